@@ -12,6 +12,7 @@
 
 import time
 import warnings
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from scipy.special import expit
@@ -174,8 +175,9 @@ REGIONAL_TAX_RATES = {
 # =============================
 # Helper Functions
 # =============================
+@lru_cache(maxsize=64)
 def map_location_to_region(project_location):
-    """Map a project location string to a region name."""
+    """Map a project location string to a region name (cached per location)."""
     project_location = project_location.lower().strip()
     for region, countries in REGION_MAP.items():
         for country in countries:
@@ -1124,6 +1126,9 @@ def run_cashflow_scenario(config):
     equity_cf_vec = pad_or_truncate(equity_cf_vec, 0)
     cumulative_equity_cf_vec = pad_or_truncate(cumulative_equity_cf_vec, 0)
     debt_drawdown_vec = pad_or_truncate(debt_drawdown_vec, 0)
+    # Principal + interest paid each year, including interest during construction.
+    # Not the DSCR denominator (debt_service_vec above), which excludes it
+    total_debt_service_vec = [p + i for p, i in zip(principal_paid_vec, interest_paid_vec)]
     df = pd.DataFrame(
         {
             "Year": year_labels,
@@ -1188,6 +1193,7 @@ def run_cashflow_scenario(config):
         "depreciation_vec": depreciation_vec,
         "interest_paid_vec": interest_paid_vec,
         "principal_paid_vec": principal_paid_vec,
+        "total_debt_service_vec": total_debt_service_vec,
         "tax_vec": tax_vec,
         "unlevered_cf_vec": unlevered_cf_vec,
         "cumulative_unlevered_cf_vec": cumulative_unlevered_cf_vec,
@@ -5,7 +5,7 @@ Full PyFECONS port with backward-compatible adapter layer.
 """
 
 # Main entry point (backward compatible)
-from .adapter import compute_total_epc_cost, format_cost_summary
+from .adapter import compute_total_epc_cost, compute_total_epc_cost_batch, format_cost_summary
 
 # New PyFECONS architecture (for advanced usage)
 from .costing_data import CostingData
@@ -17,6 +17,7 @@ from .enums_new import (
 
 __all__ = [
     "compute_total_epc_cost",
+    "compute_total_epc_cost_batch",
     "format_cost_summary",
     "CostingData",
     "MATERIALS",
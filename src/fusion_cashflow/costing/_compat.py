@@ -0,0 +1,6 @@
+"""Python-version shims for the costing package."""
+import sys
+
+# The costing containers are built field-by-field on every evaluation, so use
+# slotted dataclasses where available (slots= needs Python 3.10+).
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
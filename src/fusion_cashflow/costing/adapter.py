@@ -4,7 +4,8 @@ This module provides the `compute_total_epc_cost(config: dict) -> dict` function
 that maintains compatibility with the existing application while using the new
 PyFECONS-based costing system internally.
 """
-from typing import Dict, Any
+from collections import ChainMap
+from typing import Dict, Any, Mapping
 
 from .costing_data import CostingData
 from .units import MW, Meters, M_USD
@@ -29,6 +30,95 @@ from .calculations.cas_calcs import (
 )
 
 
+# Config string -> costing code/enum lookups, built once at import
+_REACTOR_TYPE_MAP = {
+    # Legacy/raw codes
+    'tokamak': ReactorType.MFE_TOKAMAK,
+    'mirror': ReactorType.MFE_MIRROR,
+    'laser': ReactorType.IFE_LASER,
+    # Dashboard codes (from get_config_from_widgets reactor_type_code mapping)
+    'MFE': ReactorType.MFE_TOKAMAK,
+    'IFE': ReactorType.IFE_LASER,
+}
+
+_FUEL_TYPE_MAP = {
+    # Canonical codes
+    'DT': FuelType.DT, 'DD': FuelType.DD, 'DHe3': FuelType.DHe3, 'pB11': FuelType.pB11,
+    # Dashboard codes (uppercase from fuel_type_code mapping)
+    'DHE3': FuelType.DHe3, 'PB11': FuelType.pB11,
+}
+
+_FIRST_WALL_MATERIAL_MAP = {
+    # Dashboard format
+    'Tungsten': 'W',
+    'Beryllium': 'Be',
+    'Liquid Lithium': 'Li',
+    'FLiBe': 'FLiBe',
+    # Legacy format with codes
+    'Tungsten (W)': 'W',
+    'Beryllium (Be)': 'Be',
+    'Stainless Steel (SS316)': 'SS316',
+    'Ferritic Steel (FMS)': 'FS',
+    # Raw codes
+    'W': 'W',
+    'Be': 'Be',
+    'Li': 'Li',
+    'FS': 'FS',
+    'SS316': 'SS316',
+}
+
+_BLANKET_BREEDER_MAP = {
+    # Dashboard format
+    'Solid Breeder (Li2TiO3)': 'Li2TiO3',
+    'Solid Breeder (Li4SiO4)': 'Li4SiO4',
+    'Flowing Liquid Breeder (PbLi)': 'PbLi',
+    'No Breeder (Aneutronic)': 'Li4SiO4',  # Default fallback
+    # Raw codes
+    'Li2TiO3': 'Li2TiO3',
+    'Li4SiO4': 'Li4SiO4',
+    'PbLi': 'PbLi',
+    'FLiBe': 'FLiBe',
+}
+
+_STRUCTURE_MATERIAL_MAP = {
+    # Dashboard format
+    'Stainless Steel (SS)': 'SS316',
+    'Ferritic Steel (FMS)': 'FS',
+    'ODS Steel': 'FS',  # Approximate as ferritic steel
+    'Vanadium': 'V',
+    # Raw codes
+    'SS316': 'SS316',
+    'FS': 'FS',
+    'V': 'V',
+}
+
+_BLANKET_COOLANT_MAP = {
+    'H2O': BlanketPrimaryCoolant.WATER,
+    'He': BlanketPrimaryCoolant.HELIUM,
+    'FLiBe': BlanketPrimaryCoolant.FLIBE,
+    'PbLi': BlanketPrimaryCoolant.PBLI
+}
+
+_BLANKET_MULTIPLIER_MAP = {
+    'Be': BlanketNeutronMultiplier.BE,
+    'Pb': BlanketNeutronMultiplier.PB,
+    'None': BlanketNeutronMultiplier.NONE
+}
+
+_MAGNET_TYPE_MAP = {
+    # Dashboard format
+    'HTS REBCO': MagnetType.HTS,
+    'HTS Cable-in-Conduit': MagnetType.HTS,
+    'LTS NbTi': MagnetType.LTS,
+    'LTS Nb3Sn': MagnetType.LTS,
+    'Copper (resistive)': MagnetType.COPPER,
+    # Legacy/raw format
+    'HTS': MagnetType.HTS,
+    'LTS': MagnetType.LTS,
+    'Copper': MagnetType.COPPER,
+}
+
+
 def _config_to_costing_data(config: dict) -> CostingData:
     """Convert flat config dict to CostingData dataclass.
     
@@ -47,24 +137,10 @@ def _config_to_costing_data(config: dict) -> CostingData:
         data.basic.p_et = MW(config['thermal_power_mw'])
     
     if 'reactor_type' in config:
-        rt_map = {
-            # Legacy/raw codes\n            'tokamak': ReactorType.MFE_TOKAMAK,
-            'mirror': ReactorType.MFE_MIRROR,
-            'laser': ReactorType.IFE_LASER,
-            # Dashboard codes (from get_config_from_widgets reactor_type_code mapping)
-            'MFE': ReactorType.MFE_TOKAMAK,
-            'IFE': ReactorType.IFE_LASER,
-        }
-        data.basic.reactor_type = rt_map.get(config['reactor_type'], ReactorType.MFE_TOKAMAK)
+        data.basic.reactor_type = _REACTOR_TYPE_MAP.get(config['reactor_type'], ReactorType.MFE_TOKAMAK)
     
     if 'fuel_type' in config:
-        ft_map = {
-            # Canonical codes
-            'DT': FuelType.DT, 'DD': FuelType.DD, 'DHe3': FuelType.DHe3, 'pB11': FuelType.pB11,
-            # Dashboard codes (uppercase from fuel_type_code mapping)
-            'DHE3': FuelType.DHe3, 'PB11': FuelType.pB11,
-        }
-        data.basic.fuel_type = ft_map.get(config['fuel_type'], FuelType.DT)
+        data.basic.fuel_type = _FUEL_TYPE_MAP.get(config['fuel_type'], FuelType.DT)
     
     if 'lsa_level' in config:
         data.basic.lsa_level = LSALevel(config['lsa_level'])
@@ -127,61 +203,20 @@ def _config_to_costing_data(config: dict) -> CostingData:
     
     # Map first_wall_material (handle all known formats)
     if 'first_wall_material' in config:
-        fw_map = {
-            # Dashboard format
-            'Tungsten': 'W',
-            'Beryllium': 'Be',
-            'Liquid Lithium': 'Li',
-            'FLiBe': 'FLiBe',
-            # Legacy format with codes
-            'Tungsten (W)': 'W',
-            'Beryllium (Be)': 'Be',
-            'Stainless Steel (SS316)': 'SS316',
-            'Ferritic Steel (FMS)': 'FS',
-            # Raw codes
-            'W': 'W',
-            'Be': 'Be',
-            'Li': 'Li',
-            'FS': 'FS',
-            'SS316': 'SS316',
-        }
-        data.cas220101_in.first_wall_material = fw_map.get(
+        data.cas220101_in.first_wall_material = _FIRST_WALL_MATERIAL_MAP.get(
             config['first_wall_material'], 
             config['first_wall_material']  # Pass through if not in map
         )
     
     # Map blanket_type to blanket_breeder_material
     if 'blanket_type' in config:
-        blanket_map = {
-            # Dashboard format
-            'Solid Breeder (Li2TiO3)': 'Li2TiO3',
-            'Solid Breeder (Li4SiO4)': 'Li4SiO4',
-            'Flowing Liquid Breeder (PbLi)': 'PbLi',
-            'No Breeder (Aneutronic)': 'Li4SiO4',  # Default fallback
-            # Raw codes
-            'Li2TiO3': 'Li2TiO3',
-            'Li4SiO4': 'Li4SiO4',
-            'PbLi': 'PbLi',
-            'FLiBe': 'FLiBe',
-        }
-        data.cas220101_in.blanket_breeder_material = blanket_map.get(
+        data.cas220101_in.blanket_breeder_material = _BLANKET_BREEDER_MAP.get(
             config['blanket_type'], 'Li4SiO4'
         )
     
     # Map structure_material to blanket/shield structural materials
     if 'structure_material' in config:
-        structure_map = {
-            # Dashboard format
-            'Stainless Steel (SS)': 'SS316',
-            'Ferritic Steel (FMS)': 'FS',
-            'ODS Steel': 'FS',  # Approximate as ferritic steel
-            'Vanadium': 'V',
-            # Raw codes
-            'SS316': 'SS316',
-            'FS': 'FS',
-            'V': 'V',
-        }
-        struct_code = structure_map.get(config['structure_material'], 'FS')
+        struct_code = _STRUCTURE_MATERIAL_MAP.get(config['structure_material'], 'FS')
         data.cas220101_in.blanket_structural_material = struct_code
         data.cas220101_in.shield_material = struct_code
     
@@ -190,40 +225,17 @@ def _config_to_costing_data(config: dict) -> CostingData:
     if 'shield_material' in config:
         data.cas220101_in.shield_material = config['shield_material']
     if 'blanket_coolant' in config:
-        coolant_map = {
-            'H2O': BlanketPrimaryCoolant.WATER,
-            'He': BlanketPrimaryCoolant.HELIUM,
-            'FLiBe': BlanketPrimaryCoolant.FLIBE,
-            'PbLi': BlanketPrimaryCoolant.PBLI
-        }
-        data.cas220101_in.blanket_coolant = coolant_map.get(config['blanket_coolant'],
-                                                             BlanketPrimaryCoolant.WATER)
+        data.cas220101_in.blanket_coolant = _BLANKET_COOLANT_MAP.get(config['blanket_coolant'],
+                                                                     BlanketPrimaryCoolant.WATER)
     if 'blanket_multiplier' in config:
-        mult_map = {
-            'Be': BlanketNeutronMultiplier.BE,
-            'Pb': BlanketNeutronMultiplier.PB,
-            'None': BlanketNeutronMultiplier.NONE
-        }
-        data.cas220101_in.blanket_multiplier = mult_map.get(config['blanket_multiplier'],
-                                                             BlanketNeutronMultiplier.BE)
+        data.cas220101_in.blanket_multiplier = _BLANKET_MULTIPLIER_MAP.get(config['blanket_multiplier'],
+                                                                           BlanketNeutronMultiplier.BE)
     
     # ===== CAS2203Inputs (magnets) =====
     # Accept both 'magnet_type' (legacy) and 'magnet_technology' (dashboard) keys
     magnet_tech = config.get('magnet_type') or config.get('magnet_technology')
     if magnet_tech:
-        mag_map = {
-            # Dashboard format
-            'HTS REBCO': MagnetType.HTS,
-            'HTS Cable-in-Conduit': MagnetType.HTS,
-            'LTS NbTi': MagnetType.LTS,
-            'LTS Nb3Sn': MagnetType.LTS,
-            'Copper (resistive)': MagnetType.COPPER,
-            # Legacy/raw format
-            'HTS': MagnetType.HTS,
-            'LTS': MagnetType.LTS,
-            'Copper': MagnetType.COPPER,
-        }
-        data.cas2203_in.magnet_type = mag_map.get(magnet_tech, MagnetType.HTS)
+        data.cas2203_in.magnet_type = _MAGNET_TYPE_MAP.get(magnet_tech, MagnetType.HTS)
     
     if 'n_tf_coils' in config:
         data.cas2203_in.n_tf_coils = int(config['n_tf_coils'])
@@ -427,14 +439,14 @@ def _costing_data_to_result_dict(data: CostingData) -> Dict[str, Any]:
     return result
 
 
-def compute_total_epc_cost(config: dict) -> dict:
+def compute_total_epc_cost(config: Mapping[str, Any]) -> dict:
     """Compute total EPC cost from configuration dict.
     
     This is the main entry point for backward compatibility with the existing
     application. It maintains the exact same signature as the old implementation.
     
     Args:
-        config: Configuration dict with keys:
+        config: Configuration dict (or any mapping) with keys:
             - thermal_power_mw: Thermal power [MW]
             - net_electric_mw: Net electric power [MW]
             - q_plasma: Plasma Q
@@ -477,6 +489,32 @@ def compute_total_epc_cost(config: dict) -> dict:
     return result
 
 
+def compute_total_epc_cost_batch(base_config: dict, field: str, values) -> list:
+    """Cost base_config once per value of a single swept field.
+    
+    Args:
+        base_config: Config dict shared by every variant
+        field: Config key to sweep (e.g. 'magnet_type', 'blanket_material')
+        values: Values to assign to `field`, in order
+        
+    Returns:
+        List of result dicts (as from compute_total_epc_cost), one per value.
+        A value whose costing raises gets {'error': str(e)} in its slot and
+        the sweep carries on with the next value.
+    """
+    # One overlay reused for every variant instead of copying base_config each time
+    overlay = {}
+    config = ChainMap(overlay, base_config)
+    results = []
+    for value in values:
+        overlay[field] = value
+        try:
+            results.append(compute_total_epc_cost(config))
+        except Exception as e:
+            results.append({'error': str(e)})
+    return results
+
+
 # Legacy helper
 def format_cost_summary(results: dict) -> str:
     """Format cost results as human-readable summary (legacy).
@@ -1,10 +1,11 @@
 """CAS 21 output (Buildings and structures)."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import M_USD
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS21Output:
     """CAS 21 - Buildings and structures cost outputs."""
     
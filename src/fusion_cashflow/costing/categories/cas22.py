@@ -1,10 +1,11 @@
 """CAS 22 output (Reactor Plant Equipment)."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import M_USD
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220101Output:
     """CAS 22.01.01 - First wall, blanket, shield."""
     
@@ -20,49 +21,49 @@ class CAS220101Output:
         ]))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220102Output:
     """CAS 22.01.02 - High-temperature shield."""
     
     C22010200: M_USD = M_USD(0.0)  # TOTAL 22.01.02
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220103Output:
     """CAS 22.01.03 - Support structure."""
     
     C22010300: M_USD = M_USD(0.0)  # TOTAL 22.01.03
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220104Output:
     """CAS 22.01.04 - Penetrations and access."""
     
     C22010400: M_USD = M_USD(0.0)  # TOTAL 22.01.04
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220105Output:
     """CAS 22.01.05 - Vessel."""
     
     C22010500: M_USD = M_USD(0.0)  # TOTAL 22.01.05
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220106Output:
     """CAS 22.01.06 - Pressure suppression system."""
     
     C22010600: M_USD = M_USD(0.0)  # TOTAL 22.01.06
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220107Output:
     """CAS 22.01.07 - Vacuum system auxiliary."""
     
     C22010700: M_USD = M_USD(0.0)  # TOTAL 22.01.07
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2201Output:
     """CAS 22.01 - Blanket and first wall system (aggregate)."""
     
@@ -103,14 +104,14 @@ class CAS2201Output:
         ]))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2202Output:
     """CAS 22.02 - Main heat transfer system."""
     
     C220200: M_USD = M_USD(0.0)  # TOTAL CAS 22.02
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2203Output:
     """CAS 22.03 - Magnet systems."""
     
@@ -129,35 +130,35 @@ class CAS2203Output:
         ]))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2204Output:
     """CAS 22.04 - Supplementary heating/Target factory."""
     
     C220400: M_USD = M_USD(0.0)  # TOTAL CAS 22.04
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2205Output:
     """CAS 22.05 - Primary structure and support."""
     
     C220500: M_USD = M_USD(0.0)  # TOTAL CAS 22.05
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2206Output:
     """CAS 22.06 - Vacuum pumping system."""
     
     C220600: M_USD = M_USD(0.0)  # TOTAL CAS 22.06
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2207Output:
     """CAS 22.07 - Power supplies."""
     
     C220700: M_USD = M_USD(0.0)  # TOTAL CAS 22.07
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS22Output:
     """CAS 22 - Reactor Plant Equipment (aggregate)."""
     
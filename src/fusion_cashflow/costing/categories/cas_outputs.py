@@ -1,94 +1,95 @@
 """CAS 23-90 output dataclasses."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import M_USD, MW
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS23Output:
     """CAS 23 - Turbine plant equipment."""
     C230000: M_USD = M_USD(0.0)  # TOTAL CAS 23
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS24Output:
     """CAS 24 - Electric plant equipment."""
     C240000: M_USD = M_USD(0.0)  # TOTAL CAS 24
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS25Output:
     """CAS 25 - Miscellaneous plant equipment."""
     C250000: M_USD = M_USD(0.0)  # TOTAL CAS 25
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS26Output:
     """CAS 26 - Heat rejection system."""
     C260000: M_USD = M_USD(0.0)  # TOTAL CAS 26
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS27Output:
     """CAS 27 - Fuel handling and storage."""
     C270000: M_USD = M_USD(0.0)  # TOTAL CAS 27
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS28Output:
     """CAS 28 - Instrumentation and control."""
     C280000: M_USD = M_USD(0.0)  # TOTAL CAS 28
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS29Output:
     """CAS 29 - Contingency."""
     C290000: M_USD = M_USD(0.0)  # TOTAL CAS 29
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS30Output:
     """CAS 30 - Indirect costs (construction services)."""
     C300000: M_USD = M_USD(0.0)  # TOTAL CAS 30
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS40Output:
     """CAS 40 - Owner costs."""
     C400000: M_USD = M_USD(0.0)  # TOTAL CAS 40
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS50Output:
     """CAS 50 - Capitalized supplementary costs."""
     C500000: M_USD = M_USD(0.0)  # TOTAL CAS 50
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS60Output:
     """CAS 60 - Capitalized O&M (spares, initial inventory)."""
     C600000: M_USD = M_USD(0.0)  # TOTAL CAS 60
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS70Output:
     """CAS 70 - Annualized O&M costs."""
     C700000: M_USD = M_USD(0.0)  # Annual O&M [M$/yr]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS80Output:
     """CAS 80 - Annualized fuel costs."""
     C800000: M_USD = M_USD(0.0)  # Annual fuel [M$/yr]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS90Output:
     """CAS 90 - Annualized financial costs."""
     C900000: M_USD = M_USD(0.0)  # Annual financial [M$/yr]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LCOEOutput:
     """Levelized Cost of Electricity."""
     lcoe_usd_per_mwh: float = 0.0  # LCOE [$/MWh]
@@ -99,7 +100,7 @@ class LCOEOutput:
     fuel_component: float = 0.0      # Fuel contribution to LCOE [$/MWh]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PowerBalanceOutput:
     """Power balance outputs."""
     
@@ -6,6 +6,7 @@ for a complete PyFECONS costing calculation.
 from dataclasses import dataclass, field
 from typing import Dict
 
+from ._compat import DATACLASS_SLOTS
 from .units import M_USD, Meters3
 from .inputs.basic import BasicInputs
 from .inputs.power_balance import PowerBalanceInputs
@@ -31,7 +32,7 @@ from .categories.cas_outputs import (
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CostingData:
     """Master container for all costing inputs and outputs.
     
@@ -1,11 +1,12 @@
 """Basic input parameters for costing calculations."""
 from dataclasses import dataclass, field
 
+from .._compat import DATACLASS_SLOTS
 from ..units import MW
 from ..enums_new import ReactorType, FuelType, LSALevel, Region
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BasicInputs:
     """Core reactor parameters for costing."""
     
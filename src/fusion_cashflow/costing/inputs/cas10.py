@@ -1,10 +1,11 @@
 """CAS 10 (Pre-construction) input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import M_USD
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS10Inputs:
     """Pre-construction costs."""
     
@@ -1,8 +1,10 @@
 """CAS 21 (Buildings) input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CAS21Inputs:
     """Buildings and structures inputs.
     
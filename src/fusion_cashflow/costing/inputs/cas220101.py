@@ -1,6 +1,7 @@
 """CAS 22.01.01 (First Wall, Blanket, Shield) input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import Meters
 from ..enums_new import (
     BlanketPrimaryCoolant,
@@ -10,7 +11,7 @@ from ..enums_new import (
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS220101Inputs:
     """Reactor core component inputs (first wall, blanket, shield)."""
     
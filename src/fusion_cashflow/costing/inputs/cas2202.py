@@ -1,10 +1,11 @@
 """CAS 22.02 (Main Heat Transfer) input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import MW, Meters
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2202Inputs:
     """Main heat transfer system inputs."""
     
@@ -1,11 +1,12 @@
 """CAS 22.03 (Magnet Systems) input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import Meters
 from ..enums_new import MagnetType, MagnetMaterialType
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CAS2203Inputs:
     """Magnet system inputs (TF, PF, CS coils for MFE)."""
     
@@ -1,10 +1,11 @@
 """Power balance input parameters."""
 from dataclasses import dataclass
 
+from .._compat import DATACLASS_SLOTS
 from ..units import MW
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PowerBalanceInputs:
     """Inputs for computing power flow through the reactor."""
     
@@ -266,6 +266,13 @@ MATERIAL_ALIASES = {
     'bfs': 'BFS',
 }
 
+# Flat lowercase alias -> Material table, so lookups are a single dict hit.
+# Every code's lowercase form is itself an alias above, which makes the
+# case-insensitive key cover exact-code lookups too.
+_MATERIAL_BY_ALIAS: Dict[str, Material] = {
+    alias: MATERIALS[code] for alias, code in MATERIAL_ALIASES.items()
+}
+
 
 def normalize_material_code(code: str) -> str:
     """Normalize material code, handling aliases and case variations.
@@ -279,18 +286,9 @@ def normalize_material_code(code: str) -> str:
     Raises:
         KeyError: If material code/alias not recognized
     """
-    # Try as-is first
-    if code in MATERIALS:
-        return code
-    
-    # Try lowercase lookup in aliases
-    code_lower = code.lower()
-    if code_lower in MATERIAL_ALIASES:
-        return MATERIAL_ALIASES[code_lower]
-    
-    # Try exact match in aliases
-    if code in MATERIAL_ALIASES:
-        return MATERIAL_ALIASES[code]
+    material = _MATERIAL_BY_ALIAS.get(code.lower())
+    if material is not None:
+        return material.code
     
     # Not found
     raise KeyError(
@@ -312,8 +310,10 @@ def get_material(code: str) -> Material:
     Raises:
         KeyError: If material code not found
     """
-    normalized = normalize_material_code(code)
-    return MATERIALS[normalized]
+    material = _MATERIAL_BY_ALIAS.get(code.lower())
+    if material is None:
+        normalize_material_code(code)  # raises KeyError with the full message
+    return material
 
 
 def get_material_cost(code: str, volume_m3: float) -> M_USD:
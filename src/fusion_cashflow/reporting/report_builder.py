@@ -166,15 +166,7 @@ def _prepare_nodes(outputs):
     om = sum(outputs["om_vec"][op_slice])
     taxes = sum(outputs["tax_vec"][op_slice])
     noi = revenue - om - taxes
-    debt_service = sum(
-        [
-            a + b
-            for a, b in zip(
-                outputs["principal_paid_vec"][op_slice],
-                outputs["interest_paid_vec"][op_slice],
-            )
-        ]
-    )
+    debt_service = sum(outputs["total_debt_service_vec"][op_slice])
     interest = sum(outputs["interest_paid_vec"][op_slice])
     principal = sum(outputs["principal_paid_vec"][op_slice])
     residual = noi - debt_service
@@ -149,12 +149,7 @@ def main():
             "Year": outputs["year_labels_int"],
             "DSCR": outputs["dscr_vec"],
             "NOI": outputs["noi_vec"],
-            "Debt Service": [
-                a + b
-                for a, b in zip(
-                    outputs["principal_paid_vec"], outputs["interest_paid_vec"]
-                )
-            ],
+            "Debt Service": outputs["total_debt_service_vec"],
         }
     )
     dscr_source = ColumnDataSource(dscr_df)
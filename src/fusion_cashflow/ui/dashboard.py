@@ -1,6 +1,9 @@
 import sys
 import os
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # Add the src directory to Python path for module imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,10 +14,13 @@ print(f"Added to sys.path: {os.path.abspath(src_path)}")  # Debug print
 
 import holoviews as hv
 
+import numpy as np
 import pandas as pd
+from scipy.stats import qmc
 
 hv.extension("bokeh")
 from bokeh.io import curdoc
+from tornado.ioloop import IOLoop
 from bokeh.layouts import row, column, Spacer
 from bokeh.models import (
     TextInput,
@@ -30,6 +36,7 @@ from bokeh.models import (
     Tabs,
     TabPanel,
     RadioButtonGroup,
+    InlineStyleSheet,
 )
 
 # Import costing panel module
@@ -292,6 +299,7 @@ from fusion_cashflow.core.cashflow_engine import (
     run_sensitivity_analysis,
     get_avg_annual_return,
 )
+from fusion_cashflow.core.power_to_epc import get_regional_factor
 from fusion_cashflow.visualization.bokeh_plots import (
     plot_annual_cashflow_bokeh,
     plot_cumulative_cashflow_bokeh,
@@ -930,6 +938,39 @@ debounce_timer = None
 DEBOUNCE_DELAY = 0.8  # seconds
 
 
+def annual_source_data(outputs):
+    """Column dict for the annual cashflow table/source."""
+    return {
+        "Year": outputs["year_labels_int"],
+        "Unlevered CF": outputs["unlevered_cf_vec"],
+        "Levered CF": outputs["levered_cf_vec"],
+        "Revenue": outputs["revenue_vec"],
+        "O&M": outputs["om_vec"],
+        "Fuel": outputs["fuel_vec"],
+        "Tax": outputs["tax_vec"],
+        "NOI": outputs["noi_vec"],
+    }
+
+
+def cum_source_data(outputs):
+    """Column dict for the cumulative cashflow table/source."""
+    return {
+        "Year": outputs["year_labels_int"],
+        "Cumulative Unlevered CF": outputs["cumulative_unlevered_cf_vec"],
+        "Cumulative Levered CF": outputs["cumulative_levered_cf_vec"],
+    }
+
+
+def dscr_source_data(outputs):
+    """Column dict for the DSCR table/source."""
+    return {
+        "Year": outputs["year_labels_int"],
+        "DSCR": outputs["dscr_vec"],
+        "NOI": outputs["noi_vec"],
+        "Debt Service": outputs["total_debt_service_vec"],
+    }
+
+
 def update_dashboard():
     config = get_config_from_widgets(widgets)
     
@@ -1052,47 +1093,26 @@ def update_dashboard():
         widgets["auto_epc_display"].text = f"<div style='margin-bottom:10px; color:#ff6b6b; font-size:18px; font-weight:800; font-family:Inter, Helvetica, Arial, sans-serif;'><b>Total EPC Cost:</b> Error: {str(e)[:50]}...</div>"
     
     outputs = run_cashflow_scenario(config)
+    render_outputs(outputs, config)
+
+
+def render_outputs(outputs, config):
+    """Push a scenario's outputs into the metric divs, plots, tables and costing tab."""
     highlight_div.text = render_highlight_facts(outputs)
     dscr_metrics_div.text = render_dscr_metrics(outputs)
     equity_metrics_div.text = render_equity_metrics(outputs)
     annual_fig = plot_annual_cashflow_bokeh(outputs, config)
     cum_fig = plot_cumulative_cashflow_bokeh(outputs, config)
     dscr_fig = plot_dscr_profile_bokeh(outputs, config)
-    annual_df = pd.DataFrame({
-        "Year": outputs["year_labels_int"],
-        "Unlevered CF": outputs["unlevered_cf_vec"],
-        "Levered CF": outputs["levered_cf_vec"],
-        "Revenue": outputs["revenue_vec"],
-        "O&M": outputs["om_vec"],
-        "Fuel": outputs["fuel_vec"],
-        "Tax": outputs["tax_vec"],
-        "NOI": outputs["noi_vec"],
-    })
-    annual_source.data = dict(ColumnDataSource(annual_df).data)
-    cum_df = pd.DataFrame({
-        "Year": outputs["year_labels_int"],
-        "Cumulative Unlevered CF": outputs["cumulative_unlevered_cf_vec"],
-        "Cumulative Levered CF": outputs["cumulative_levered_cf_vec"],
-    })
-    cum_source.data = dict(ColumnDataSource(cum_df).data)
-    dscr_df = pd.DataFrame({
-        "Year": outputs["year_labels_int"],
-        "DSCR": outputs["dscr_vec"],
-        "NOI": outputs["noi_vec"],
-        "Debt Service": [a + b for a, b in zip(outputs["principal_paid_vec"], outputs["interest_paid_vec"])]
-    })
-    dscr_source.data = dict(ColumnDataSource(dscr_df).data)
+    annual_source.data = annual_source_data(outputs)
+    cum_source.data = cum_source_data(outputs)
+    dscr_source.data = dscr_source_data(outputs)
     
-    # Update costing panel if EPC breakdown is available
+    # Update costing panel if EPC breakdown is available (built only if the tab is showing)
     epc_breakdown = outputs.get("epc_breakdown", {})
     if epc_breakdown:
-        # Store region factor in config for driver analysis
-        if not config.get('_region_factor'):
-            from fusion_cashflow.core.power_to_epc import get_regional_factor
-            config['_region_factor'] = get_regional_factor(config['project_location'])
-        
-        updated_costing_panel = create_costing_panel(epc_breakdown, config)
-        costing_col.children = [updated_costing_panel]
+        _set_costing_inputs(epc_breakdown, config)
+        _render_costing_if_needed(tabs.active)
     
     # Replace plots in layout (main tab only)
     main_col.children = [
@@ -1117,6 +1137,8 @@ def update_dashboard():
 
 
 debounce_callback_id = None
+# True while code (not the user) is setting widget values; widget callbacks skip the update
+_suppress_callbacks = False
 
 
 def debounced_update():
@@ -1353,6 +1375,7 @@ except Exception as e:
         "dscr_vec": [0] * 60,
         "principal_paid_vec": [0] * 60,
         "interest_paid_vec": [0] * 60,
+        "total_debt_service_vec": [0] * 60,
         "npv": 0,
         "irr": 0,
         "lcoe_val": 0,
@@ -1372,68 +1395,12 @@ placeholder_fig = figure(height=400, width=700, title="Click 'Run Sensitivity An
 placeholder_fig.text(x=[0.5], y=[0.5], text=["No sensitivity data yet."], text_align="center", text_baseline="middle", text_font_size="16pt")
 
 
-annual_df = pd.DataFrame(
-    {
-        "Year": outputs["year_labels_int"],
-        "Unlevered CF": outputs["unlevered_cf_vec"],
-        "Levered CF": outputs["levered_cf_vec"],
-        "Revenue": outputs["revenue_vec"],
-        "O&M": outputs["om_vec"],
-        "Fuel": outputs["fuel_vec"],
-        "Tax": outputs["tax_vec"],
-        "NOI": outputs["noi_vec"],
-    }
-)
-annual_source = ColumnDataSource(annual_df)
+annual_source = ColumnDataSource(data=annual_source_data(outputs))
+cum_source = ColumnDataSource(data=cum_source_data(outputs))
+dscr_source = ColumnDataSource(data=dscr_source_data(outputs))
 
-cum_df = pd.DataFrame(
-    {
-        "Year": outputs["year_labels_int"],
-        "Cumulative Unlevered CF": outputs["cumulative_unlevered_cf_vec"],
-        "Cumulative Levered CF": outputs["cumulative_levered_cf_vec"],
-    }
-)
-cum_source = ColumnDataSource(cum_df)
-
-dscr_df = pd.DataFrame(
-    {
-        "Year": outputs["year_labels_int"],
-        "DSCR": outputs["dscr_vec"],
-        "NOI": outputs["noi_vec"],
-        "Debt Service": [
-            a + b
-            for a, b in zip(outputs["principal_paid_vec"], outputs["interest_paid_vec"])
-        ],
-    }
-)
-dscr_source = ColumnDataSource(dscr_df)
-
-funding_df = pd.DataFrame(
-    {
-        "Label": [
-            "Debt",
-            "Equity",
-            "EPC",
-            "Extra CapEx",
-            "Project Contingency",
-            "Process Contingency",
-            "Financing Fees",
-        ],
-        "Amount": [
-            sum(outputs["debt_drawdown_vec"][: outputs["years_construction"]]),
-            outputs["toc"]
-            - sum(outputs["debt_drawdown_vec"][: outputs["years_construction"]]),
-            outputs.get("total_epc_cost", 5_000_000_000),  # Get from outputs
-            outputs.get("total_epc_cost", 5_000_000_000) * config["extra_capex_pct"],
-            outputs.get("total_epc_cost", 5_000_000_000) * config["project_contingency_pct"],
-            outputs.get("total_epc_cost", 5_000_000_000) * config["process_contingency_pct"],
-            outputs.get("total_epc_cost", 5_000_000_000) * config["financing_fee"],
-        ],
-    }
-)
-funding_source = ColumnDataSource(funding_df)
-# sens_source = ColumnDataSource(sensitivity_df)
-sens_source = ColumnDataSource(pd.DataFrame())
+# Filled by run_sensitivity_callback
+sens_source = ColumnDataSource(data={})
 
 
 # --- Plots ---
@@ -1445,6 +1412,10 @@ dscr_fig = plot_dscr_profile_bokeh(outputs, config)
 # --- Tables ---
 from bokeh.models import CustomJS
 
+# Shared cell formatters (one Bokeh model each, reused by every table column)
+_money_fmt = NumberFormatter(format="$0,0")
+_ratio_fmt = NumberFormatter(format="0.00")
+
 # Create toggle buttons for table explanations
 annual_toggle_button = Button(label="Table Column Explanations ▼", button_type="default", width=300, 
                             styles={"background": "#FFFFFF", "color": "#00375b"})
@@ -1478,13 +1449,13 @@ annual_toggle_button.js_on_click(annual_toggle_callback)
 
 annual_columns = [
     TableColumn(field="Year", title="Year"),
-    TableColumn(field="Unlevered CF", title="Unlevered CF", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Levered CF", title="Levered CF", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Revenue", title="Revenue", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="O&M", title="O&M", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Fuel", title="Fuel", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Tax", title="Tax", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="NOI", title="NOI", formatter=NumberFormatter(format="$0,0")),
+    TableColumn(field="Unlevered CF", title="Unlevered CF", formatter=_money_fmt),
+    TableColumn(field="Levered CF", title="Levered CF", formatter=_money_fmt),
+    TableColumn(field="Revenue", title="Revenue", formatter=_money_fmt),
+    TableColumn(field="O&M", title="O&M", formatter=_money_fmt),
+    TableColumn(field="Fuel", title="Fuel", formatter=_money_fmt),
+    TableColumn(field="Tax", title="Tax", formatter=_money_fmt),
+    TableColumn(field="NOI", title="NOI", formatter=_money_fmt),
 ]
 annual_table = DataTable(source=annual_source, columns=annual_columns, width=900, height=220, index_position=None)
 
@@ -1518,8 +1489,8 @@ cum_toggle_button.js_on_click(cum_toggle_callback)
 
 cum_columns = [
     TableColumn(field="Year", title="Year"),
-    TableColumn(field="Cumulative Unlevered CF", title="Cumulative Unlevered CF", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Cumulative Levered CF", title="Cumulative Levered CF", formatter=NumberFormatter(format="$0,0")),
+    TableColumn(field="Cumulative Unlevered CF", title="Cumulative Unlevered CF", formatter=_money_fmt),
+    TableColumn(field="Cumulative Levered CF", title="Cumulative Levered CF", formatter=_money_fmt),
 ]
 cum_table = DataTable(source=cum_source, columns=cum_columns, width=600, height=220, index_position=None)
 
@@ -1554,9 +1525,9 @@ dscr_toggle_button.js_on_click(dscr_toggle_callback)
 
 dscr_columns = [
     TableColumn(field="Year", title="Year"),
-    TableColumn(field="DSCR", title="DSCR", formatter=NumberFormatter(format="0.00")),
-    TableColumn(field="NOI", title="NOI", formatter=NumberFormatter(format="$0,0")),
-    TableColumn(field="Debt Service", title="Debt Service", formatter=NumberFormatter(format="$0,0")),
+    TableColumn(field="DSCR", title="DSCR", formatter=_ratio_fmt),
+    TableColumn(field="NOI", title="NOI", formatter=_money_fmt),
+    TableColumn(field="Debt Service", title="Debt Service", formatter=_money_fmt),
 ]
 dscr_table = DataTable(source=dscr_source, columns=dscr_columns, width=600, height=220, index_position=None)
 
@@ -1630,9 +1601,10 @@ sens_download = make_download_button(sens_source, " Download Sensitivity Data",
 
 
 # --- Layout ---
-# Tooltip CSS for sidebar section headers (each Bokeh Div is isolated, so every tooltip needs its own style block)
-_TIP_CSS = (
-    "<style>"
+# Tooltip CSS for sidebar section headers. Each Bokeh Div renders in its own
+# shadow root, so the rules are attached per Div as one shared stylesheet model
+# rather than an inline <style> block repeated in every header's HTML.
+_TIP_SHEET = InlineStyleSheet(css=(
     ".sb-tip-wrap{position:relative;display:inline-block}"
     ".sb-tip-wrap .sb-tip{visibility:hidden;opacity:0;transition:opacity .2s;position:absolute;bottom:110%;left:50%;transform:translateX(-50%);"
     "background:#001e3c;color:#fff;font-size:11px;font-weight:400;padding:6px 10px;border-radius:6px;white-space:nowrap;"
@@ -1640,13 +1612,19 @@ _TIP_CSS = (
     ".sb-tip-wrap:hover .sb-tip{visibility:visible;opacity:1}"
     ".sb-tip-wrap .sb-lbl{cursor:help;background:rgba(160,196,255,.15);padding:2px 6px;border-radius:4px;transition:background .2s}"
     ".sb-tip-wrap:hover .sb-lbl{background:rgba(160,196,255,.3)}"
-    "</style>"
-)
+))
 _H3 = "margin-top:20px;color:#ffffff; font-family:Inter, Helvetica, Arial, sans-serif; font-weight:800;"
 
+def _section(label: str) -> Div:
+    """Return a plain sidebar section header Div."""
+    return Div(text=f"<h3 style='{_H3}'>{label}</h3>")
+
 def _section_tip(label: str, tip: str) -> Div:
     """Return a sidebar section header Div with a hover tooltip."""
-    return Div(text=f"<h3 style='{_H3}'>{_TIP_CSS}<span class='sb-tip-wrap'><span class='sb-lbl'>{label}<sup>?</sup></span><span class='sb-tip'>{tip}</span></span></h3>")
+    return Div(
+        text=f"<h3 style='{_H3}'><span class='sb-tip-wrap'><span class='sb-lbl'>{label}<sup>?</sup></span><span class='sb-tip'>{tip}</span></span></h3>",
+        stylesheets=[_TIP_SHEET],
+    )
 
 sidebar = column(
     Div(text=APPLE_CSS),
@@ -1683,7 +1661,7 @@ sidebar = column(
     widgets["noak"],
     
     # Power Balance Parameters
-    Div(text="<h3 style='margin-top:20px;color:#ffffff; font-family:Inter, Helvetica, Arial, sans-serif; font-weight:800;'>Power Balance</h3>"),
+    _section("Power Balance"),
     widgets["fusion_power_mw"],
     widgets["q_plasma"],
     widgets["derived_heating_power"],
@@ -1763,7 +1741,7 @@ sidebar = column(
     widgets["ramp_up_rate_per_year"],
     
     # Optimization
-    Div(text="<h3 style='margin-top:20px;color:#ffffff; font-family:Inter, Helvetica, Arial, sans-serif; font-weight:800;'>Optimisation — Experimental</h3>"),
+    _section("Optimisation — Experimental"),
     row(widgets["optimise_target"], Spacer(width=10), widgets["optimise_button"]),
     widgets["optimise_status"],
     
@@ -1822,17 +1800,18 @@ grey_container_style = {
 # Create a container for the plot
 sens_fig = placeholder_fig
 sens_plot_container = column(sens_fig, sizing_mode="stretch_width", styles=grey_container_style)
+run_sens_btn = Button(
+    label="Run Sensitivity Analysis",
+    button_type="primary",
+    width=220,
+    name="run_sens_btn",
+)
 sens_col = column(
     Div(
         text="<h3 style='color:#00375b; font-family:Inter, Helvetica, Arial, sans-serif; font-weight:800;'>Sensitivity Analysis</h3><p style='color:#333333; font-family:Inter, Helvetica, Arial, sans-serif;'>Click the button to recompute sensitivity analysis with current inputs.</p>"
     ),
     row(
-        Button(
-            label="Run Sensitivity Analysis",
-            button_type="primary",
-            width=220,
-            name="run_sens_btn",
-        ),
+        run_sens_btn,
         sens_download,
         Spacer(width=20),  # Add some spacing between buttons
     ),
@@ -1842,16 +1821,45 @@ sens_col = column(
 sens_tab = TabPanel(child=sens_col, title="Sensitivity Analysis")
 
 # --- Costing Breakdown Tab ---
-# Create initial costing panel with current outputs
-epc_breakdown = outputs.get("epc_breakdown", {})
-if epc_breakdown:
+# The panel is built lazily: only when the tab is first shown, and again after a
+# recalculation while it is showing. Until then the tab holds a placeholder.
+_COSTING_TAB_INDEX = 2
+_costing_state = {"epc_breakdown": None, "config": None, "rendered": None}
+
+
+def _set_costing_inputs(epc_breakdown, config):
+    """Record the latest EPC breakdown/config for the costing tab."""
     # Store region factor in config for driver analysis
     if not config.get('_region_factor'):
-        from fusion_cashflow.core.power_to_epc import get_regional_factor
         config['_region_factor'] = get_regional_factor(config['project_location'])
-    
-    # Create costing panel with full EPC results and config
-    costing_panel = create_costing_panel(epc_breakdown, config)
+    _costing_state["epc_breakdown"] = epc_breakdown
+    _costing_state["config"] = config
+
+
+def _render_costing_if_needed(active):
+    """Build the costing panel if its tab is active and the breakdown is new."""
+    if active != _COSTING_TAB_INDEX:
+        return
+    epc_breakdown = _costing_state["epc_breakdown"]
+    if not epc_breakdown or _costing_state["rendered"] is epc_breakdown:
+        return
+    costing_col.children = [create_costing_panel(epc_breakdown, _costing_state["config"])]
+    _costing_state["rendered"] = epc_breakdown
+
+
+epc_breakdown = outputs.get("epc_breakdown", {})
+if epc_breakdown:
+    _set_costing_inputs(epc_breakdown, config)
+    costing_panel = column(
+        Div(
+            text="""
+            <p style='color:#ffffff; font-family:Inter, Helvetica, Arial, sans-serif;'>
+                Loading cost breakdown…
+            </p>
+            """,
+            styles=grey_container_style
+        )
+    )
 else:
     # Show placeholder if no EPC breakdown available
     costing_panel = column(
@@ -1873,12 +1881,22 @@ costing_tab = TabPanel(child=costing_col, title="Cost Breakdown")
 
 
 # --- Optimization Function (multi-variable, no nevergrad) ---
-# Global variables to track optimization state
-_optimization_running = False
-_optimization_result = None  # Store optimization results
-
-def _opt_status_html(text, color="#ffffff", bg="rgba(255,255,255,0.08)"):
+# Set while an optimisation is in flight; cleared once its result has been applied
+_opt_running = threading.Event()
+# Runs the optimiser off the server loop; one run at a time per session
+_opt_executor = ThreadPoolExecutor(max_workers=1)
+# This script re-runs per session, so release the session's worker thread when it closes
+curdoc().on_session_destroyed(lambda session_context: _opt_executor.shutdown(wait=False))
+
+# Optimiser status card colours as (text colour, background)
+_STATUS_IDLE_STYLE = ("#ffffff", "rgba(255,255,255,0.08)")
+_STATUS_BUSY_STYLE = ("#ffcc00", "rgba(255,204,0,0.10)")
+_STATUS_OK_STYLE = ("#00cc66", "rgba(0,204,102,0.10)")
+_STATUS_ERR_STYLE = ("#ff6b6b", "rgba(255,100,100,0.10)")
+
+def _opt_status_html(text, style=_STATUS_IDLE_STYLE):
     """Wrap optimiser status text in a styled card."""
+    color, bg = style
     return (
         f"<div style='padding:8px 12px;border-radius:8px;background:{bg};"
         f"color:{color};font-size:13px;font-weight:600;"
@@ -1894,109 +1912,176 @@ _OPT_VARS = {
     "plant_lifetime":   {"low": 25,   "high": 60,   "step": 1},
 }
 
-def _latin_hypercube(n, rng):
-    """Return n quasi-random samples in [0,1)^d via Latin Hypercube Sampling."""
-    import numpy as np
-    d = len(_OPT_VARS)
-    result = np.zeros((n, d))
-    for j in range(d):
-        perm = rng.permutation(n)
-        for i in range(n):
-            result[i, j] = (perm[i] + rng.random()) / n
-    return result
+# Optimiser progress goes through logging, not print(). The launcher configures no
+# logging, so setting FUSION_OPT_LOG (e.g. INFO, DEBUG for per-batch lines) attaches a
+# stderr handler; this script re-runs per session, so the handler is added only once
+_opt_log = logging.getLogger(__name__ + ".optimiser")
+_opt_log_level = os.environ.get("FUSION_OPT_LOG")
+if _opt_log_level:
+    _opt_log.setLevel(getattr(logging, _opt_log_level.upper(), logging.INFO))
+    if not _opt_log.handlers:
+        _opt_handler = logging.StreamHandler()
+        _opt_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+        _opt_log.addHandler(_opt_handler)
+        _opt_log.propagate = False
+else:
+    _opt_log.setLevel(logging.INFO)
+
+# Objective name -> (output key, fallback value when the key is missing)
+_OPT_OBJECTIVES = {
+    "IRR":  ("irr", -0.5),
+    "NPV":  ("npv", -1e10),
+    "LCOE": ("lcoe_val", 1000.0),
+}
+
+def _quasi_random(n, rng):
+    """Return n low-discrepancy samples in [0,1)^d from a scrambled Halton sequence."""
+    return qmc.Halton(d=len(_OPT_VARS), scramble=True, seed=rng).random(n)
+
+# Search-space bounds as arrays, in _OPT_VARS order
+_OPT_LOW = np.array([spec["low"] for spec in _OPT_VARS.values()], dtype=float)
+_OPT_HIGH = np.array([spec["high"] for spec in _OPT_VARS.values()], dtype=float)
+_OPT_STEP = np.array([spec["step"] for spec in _OPT_VARS.values()], dtype=float)
+
+def _snap_to_config(raw):
+    """Snap a raw d-vector to the step grid and bounds and return it as overrides."""
+    snapped = np.clip(np.round(raw / _OPT_STEP) * _OPT_STEP, _OPT_LOW, _OPT_HIGH)
+    return {
+        key: int(v) if isinstance(spec["step"], int) else float(v)
+        for (key, spec), v in zip(_OPT_VARS.items(), snapped)
+    }
 
 def _sample_to_config(unit_vec):
     """Map a [0,1]^d vector to actual config values (respecting step)."""
-    import numpy as np
-    out = {}
-    for idx, (key, spec) in enumerate(_OPT_VARS.items()):
-        raw = spec["low"] + unit_vec[idx] * (spec["high"] - spec["low"])
-        # Snap to step
-        raw = round(raw / spec["step"]) * spec["step"]
-        raw = max(spec["low"], min(spec["high"], raw))
-        out[key] = raw
-    return out
+    return _snap_to_config(_OPT_LOW + np.asarray(unit_vec) * (_OPT_HIGH - _OPT_LOW))
 
-def run_optimiser():
-    """Multi-variable optimiser: LHS exploration + local refinement (~48 evals)."""
-    global _optimization_running, _optimization_result
-    import numpy as np
+def _config_to_unit(overrides):
+    """Inverse of _sample_to_config: map override values back to [0,1]^d."""
+    vals = np.array([overrides[key] for key in _OPT_VARS], dtype=float)
+    return (vals - _OPT_LOW) / (_OPT_HIGH - _OPT_LOW)
 
-    if _optimization_running:
-        widgets["optimise_status"].text = _opt_status_html("Optimisation already running...", "#ffcc00", "rgba(255,204,0,0.10)")
+def _surrogate_pick(X, y, candidates, k, bandwidth=0.15, kappa=0.5):
+    """Pick k candidates by lower confidence bound on a kernel-regression surrogate.
+
+    X holds evaluated points in [0,1]^d and y their scores (lower is better).
+    The surrogate mean is a Gaussian-kernel (Nadaraya-Watson) average of y; the
+    exploration term is the distance to the nearest evaluated or already-picked
+    point, so a batch spreads out instead of piling onto one predicted optimum.
+    """
+    y = (y - y.mean()) / (y.std() or 1.0)
+    d2 = ((candidates[:, None, :] - X[None, :, :]) ** 2).sum(axis=-1)
+    w = np.exp(-d2 / (2 * bandwidth ** 2))
+    wsum = w.sum(axis=1)
+    mean = np.where(wsum > 1e-12, (w @ y) / np.maximum(wsum, 1e-12), 0.0)
+    nearest = np.sqrt(d2.min(axis=1))
+    taken = np.zeros(len(candidates), dtype=bool)
+    picks = []
+    for _ in range(min(k, len(candidates))):
+        lcb = np.where(taken, np.inf, mean - kappa * nearest / bandwidth)
+        i = int(np.argmin(lcb))
+        taken[i] = True
+        picks.append(candidates[i])
+        nearest = np.minimum(nearest, np.sqrt(((candidates - candidates[i]) ** 2).sum(axis=1)))
+    return np.array(picks)
+
+def run_optimiser():
+    """Multi-variable optimiser: quasi-random exploration + surrogate-guided refinement (~49 evals)."""
+    if _opt_running.is_set():
+        widgets["optimise_status"].text = _opt_status_html("Optimisation already running...", _STATUS_BUSY_STYLE)
         return
 
-    _optimization_running = True
-    _optimization_result = None
+    _opt_running.set()
     widgets["optimise_button"].disabled = True
-    widgets["optimise_status"].text = _opt_status_html("Optimising… ~48 evaluations", "#ffcc00", "rgba(255,204,0,0.10)")
+    widgets["optimise_status"].text = _opt_status_html("Optimising… ~49 evaluations", _STATUS_BUSY_STYLE)
 
+    # Everything the worker needs from the widgets is read once, here on the document thread
     cfg0 = get_config_from_widgets(widgets)
+    metric_map = {"Max IRR": "IRR", "Max NPV": "NPV", "Min LCOE": "LCOE"}
+    objective = metric_map[widgets["optimise_target"].value]
 
     def worker():
-        global _optimization_running, _optimization_result
+        """Run the search and return the result dict handed to apply_optimization_result."""
         try:
-            metric_map = {"Max IRR": "IRR", "Max NPV": "NPV", "Min LCOE": "LCOE"}
-            objective = metric_map[widgets["optimise_target"].value]
-            minimise = (objective == "LCOE")
+            # Scores are always minimised: LCOE as-is, IRR/NPV negated
+            sign = 1.0 if objective == "LCOE" else -1.0
+            # Output key and fallback are fixed for the whole run
+            out_key, fallback = _OPT_OBJECTIVES[objective]
 
             rng = np.random.default_rng(42)
 
-            def evaluate(overrides):
-                """Run one cashflow scenario and return the objective value."""
-                cfg = cfg0.copy()
-                cfg.update(overrides)
-                out = run_cashflow_scenario(cfg)
-                val = {
-                    "IRR":  out.get("irr", -0.5),
-                    "NPV":  out.get("npv", -1e10),
-                    "LCOE": out.get("lcoe_val", 1000.0),
-                }[objective]
-                return val, overrides, out
-
-            # --- Phase 1: Latin Hypercube exploration (24 samples) ---
-            lhs = _latin_hypercube(24, rng)
-            results = []
-            for row in lhs:
-                try:
-                    overrides = _sample_to_config(row)
-                    val, ov, out = evaluate(overrides)
-                    results.append((val, ov, out))
-                except Exception:
-                    continue
+            seen = {}  # sorted overrides -> (val, overrides, out), or None if the run failed
 
-            if not results:
-                _optimization_result = {"success": False, "error": "All evaluations failed"}
-                return
-
-            # Sort: ascending for LCOE, descending for IRR/NPV
-            results.sort(key=lambda x: x[0], reverse=not minimise)
-
-            # --- Phase 2: Local refinement around top-3 (8 perturbations each) ---
-            top3 = results[:3]
-            var_keys = list(_OPT_VARS.keys())
-            for best_val, best_ov, best_out in top3:
-                for _ in range(8):
+            def run_batch(cfgs):
+                """Run scenarios serially (each takes ~1-2 ms); returns an output dict or None per config."""
+                outs = []
+                for cfg in cfgs:
                     try:
-                        perturbed = {}
-                        for key in var_keys:
-                            spec = _OPT_VARS[key]
-                            # ±10% of range, Gaussian
-                            delta = rng.normal(0, 0.10) * (spec["high"] - spec["low"])
-                            raw = best_ov[key] + delta
-                            raw = round(raw / spec["step"]) * spec["step"]
-                            raw = max(spec["low"], min(spec["high"], raw))
-                            perturbed[key] = raw
-                        val, ov, out = evaluate(perturbed)
-                        results.append((val, ov, out))
+                        outs.append(run_cashflow_scenario(cfg))
                     except Exception:
-                        continue
+                        outs.append(None)
+                return outs
+
+            def evaluate_batch(batch):
+                """Evaluate a batch of overrides and return (val, overrides, out) for each new success."""
+                # Snapped samples repeat; only run overrides not already seen this run
+                fresh = {}
+                for ov in batch:
+                    key = tuple(sorted(ov.items()))
+                    if key not in seen:
+                        fresh[key] = ov
+                outs = run_batch([{**cfg0, **ov} for ov in fresh.values()])
+                for (key, ov), out in zip(fresh.items(), outs):
+                    seen[key] = None if out is None else (out.get(out_key, fallback), ov, out)
+                ok = [seen[key] for key in fresh if seen[key] is not None]
+                _opt_log.debug("batch: %d requested, %d new, %d succeeded", len(batch), len(fresh), len(ok))
+                return ok
+
+            def scores(res):
+                """Objective values as an array where lower is better (non-finite last)."""
+                vals = np.fromiter((r[0] for r in res), dtype=float, count=len(res))
+                return np.where(np.isfinite(vals), sign * vals, np.inf)
+
+            def units(res):
+                """Unit-cube coordinates of each result, shape (len(res), d)."""
+                return np.array([_config_to_unit(ov) for _, ov, _ in res]).reshape(len(res), len(_OPT_VARS))
+
+            # --- Phase 1: current point + quasi-random (Halton) exploration (24 samples) ---
+            # Warm start: the current dashboard values go first, so the result is never worse
+            current = {key: cfg0[key] for key in _OPT_VARS}
+            seeds = _quasi_random(24, rng)
+            results = evaluate_batch([current] + [_sample_to_config(row) for row in seeds])
 
-            # Final sort and pick best
-            results.sort(key=lambda x: x[0], reverse=not minimise)
-            best_val, best_ov, best_out = results[0]
-
-            _optimization_result = {
+            if not results:
+                return {"success": False, "error": "All evaluations failed"}
+
+            # Contiguous arrays kept in step with `results` (row i <-> results[i])
+            all_scores = scores(results)
+            all_units = units(results)
+
+            # --- Phase 2: surrogate-guided refinement (3 rounds x 8 candidates) ---
+            d = len(_OPT_VARS)
+            for _ in range(3):
+                ok = np.isfinite(all_scores)
+                if not ok.any():
+                    break
+                X = all_units[ok]
+                y = all_scores[ok]
+                # Candidate pool: global uniform draws plus a cloud around the incumbent
+                candidates = np.clip(np.vstack([
+                    rng.random((256, d)),
+                    X[np.argmin(y)] + rng.normal(0, 0.10, size=(64, d)),
+                ]), 0.0, 1.0)
+                picks = _surrogate_pick(X, y, candidates, 8)
+                new = evaluate_batch([_sample_to_config(row) for row in picks])
+                results.extend(new)
+                all_scores = np.concatenate([all_scores, scores(new)])
+                all_units = np.vstack([all_units, units(new)])
+
+            # Pick best over both phases
+            best_val, best_ov, best_out = results[int(np.argmin(all_scores))]
+            _opt_log.info("%s optimum %.6g after %d evaluations: %s", objective, best_val, len(results), best_ov)
+
+            return {
                 "success": True,
                 "best_overrides": best_ov,
                 "best_val": best_val,
@@ -2006,114 +2091,88 @@ def run_optimiser():
             }
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            _optimization_result = {"success": False, "error": str(e)}
+            _opt_log.exception("Optimisation failed")
+            return {"success": False, "error": str(e)}
 
-    threading.Thread(target=worker, daemon=True).start()
-
-
-# Periodic callback to check for optimization results
-def check_optimization_results():
-    """Check if optimisation has completed and apply results."""
-    global _optimization_running, _optimization_result
+    # Run on the executor; when it finishes, apply results on the document's next tick
+    doc = curdoc()
+    loop = IOLoop.current()
+    future = loop.run_in_executor(_opt_executor, worker)
+    loop.add_future(future, lambda f: doc.add_next_tick_callback(partial(apply_optimization_result, f.result())))
 
-    if _optimization_result is not None:
-        result = _optimization_result
-        _optimization_result = None
 
-        try:
-            if result["success"]:
-                best_ov = result["best_overrides"]
-                best_val = result["best_val"]
-                objective = result["objective"]
-                n_evals = result.get("n_evals", "?")
-
-                # Apply optimised values to sliders
-                for key, val in best_ov.items():
-                    if key in widgets:
-                        widgets[key].value = val
-
-                # Re-run scenario with updated widgets and refresh dashboard
-                config_updated = get_config_from_widgets(widgets)
-                outputs_updated = run_cashflow_scenario(config_updated)
-
-                highlight_div.text = render_highlight_facts(outputs_updated)
-                dscr_metrics_div.text = render_dscr_metrics(outputs_updated)
-                equity_metrics_div.text = render_equity_metrics(outputs_updated)
-
-                annual_df = pd.DataFrame({
-                    "Year": outputs_updated["year_labels_int"],
-                    "Unlevered CF": outputs_updated["unlevered_cf_vec"],
-                    "Levered CF": outputs_updated["levered_cf_vec"],
-                    "Revenue": outputs_updated["revenue_vec"],
-                    "O&M": outputs_updated["om_vec"],
-                    "Fuel": outputs_updated["fuel_vec"],
-                    "Tax": outputs_updated["tax_vec"],
-                    "NOI": outputs_updated["noi_vec"],
-                })
-                annual_source.data = dict(ColumnDataSource(annual_df).data)
-
-                cum_df = pd.DataFrame({
-                    "Year": outputs_updated["year_labels_int"],
-                    "Cumulative Unlevered CF": outputs_updated["cumulative_unlevered_cf_vec"],
-                    "Cumulative Levered CF": outputs_updated["cumulative_levered_cf_vec"],
-                })
-                cum_source.data = dict(ColumnDataSource(cum_df).data)
-
-                dscr_df = pd.DataFrame({
-                    "Year": outputs_updated["year_labels_int"],
-                    "DSCR": outputs_updated["dscr_vec"],
-                    "NOI": outputs_updated["noi_vec"],
-                    "Debt Service": [a + b for a, b in zip(outputs_updated["principal_paid_vec"], outputs_updated["interest_paid_vec"])]
-                })
-                dscr_source.data = dict(ColumnDataSource(dscr_df).data)
-
-                # Format status message
-                delta = "↓" if objective == "LCOE" else "↑"
-                if objective == "LCOE":
-                    fmt_val = f"${best_val:,.2f}"
-                elif objective == "IRR":
-                    fmt_val = f"{best_val*100:.2f}%"
-                else:
-                    fmt_val = f"${best_val:,.0f}"
-
-                parts = []
-                _short = {"input_debt_pct": "Debt", "capacity_factor": "CF",
-                           "electricity_price": "Price", "plant_lifetime": "Life"}
-                for k, v in best_ov.items():
-                    lbl = _short.get(k, k)
-                    if k in ("input_debt_pct", "capacity_factor"):
-                        parts.append(f"{lbl} {v:.0%}")
-                    elif k == "electricity_price":
-                        parts.append(f"{lbl} ${v:.0f}/MWh")
-                    elif k == "plant_lifetime":
-                        parts.append(f"{lbl} {int(v)}yr")
-                summary = " &middot; ".join(parts)
-
-                status_text = (
-                    f"<b>{objective} {delta} {fmt_val}</b><br>"
-                    f"<span style='font-size:12px;font-weight:400;opacity:0.85;'>{summary} &nbsp;·&nbsp; {n_evals} evals</span>"
-                )
-                widgets["optimise_status"].text = _opt_status_html(status_text, "#00cc66", "rgba(0,204,102,0.10)")
+# Completion callback that applies optimisation results (runs on the document thread)
+def apply_optimization_result(result):
+    """Apply a finished optimisation result to the widgets, metrics, plots and tables."""
+    global _suppress_callbacks
 
+    # Coalesce all widget/div/source changes below into one client update
+    doc = curdoc()
+    doc.hold("combine")
+    try:
+        if result["success"]:
+            best_ov = result["best_overrides"]
+            best_val = result["best_val"]
+            objective = result["objective"]
+            n_evals = result.get("n_evals", "?")
+
+            # Apply optimised values to sliders without triggering debounced_update;
+            # the worker already ran the winning scenario, so render its outputs directly
+            _suppress_callbacks = True
+            for key, val in best_ov.items():
+                if key in widgets:
+                    widgets[key].value = val
+            render_outputs(result["best_outputs"], get_config_from_widgets(widgets))
+
+            # Format status message
+            delta = "↓" if objective == "LCOE" else "↑"
+            if objective == "LCOE":
+                fmt_val = f"${best_val:,.2f}"
+            elif objective == "IRR":
+                fmt_val = f"{best_val*100:.2f}%"
             else:
-                error_msg = result.get("error", "Unknown error")
-                widgets["optimise_status"].text = _opt_status_html(f"Optimisation failed: {error_msg[:40]}", "#ff6b6b", "rgba(255,100,100,0.10)")
+                fmt_val = f"${best_val:,.0f}"
+
+            parts = []
+            _short = {"input_debt_pct": "Debt", "capacity_factor": "CF",
+                       "electricity_price": "Price", "plant_lifetime": "Life"}
+            for k, v in best_ov.items():
+                lbl = _short.get(k, k)
+                if k in ("input_debt_pct", "capacity_factor"):
+                    parts.append(f"{lbl} {v:.0%}")
+                elif k == "electricity_price":
+                    parts.append(f"{lbl} ${v:.0f}/MWh")
+                elif k == "plant_lifetime":
+                    parts.append(f"{lbl} {int(v)}yr")
+            summary = " &middot; ".join(parts)
+
+            status_text = (
+                f"<b>{objective} {delta} {fmt_val}</b><br>"
+                f"<span style='font-size:12px;font-weight:400;opacity:0.85;'>{summary} &nbsp;·&nbsp; {n_evals} evals</span>"
+            )
+            widgets["optimise_status"].text = _opt_status_html(status_text, _STATUS_OK_STYLE)
 
-        except Exception as apply_error:
-            import traceback
-            traceback.print_exc()
-            widgets["optimise_status"].text = _opt_status_html(f"Apply error: {str(apply_error)[:40]}", "#ff6b6b", "rgba(255,100,100,0.10)")
+        else:
+            error_msg = result.get("error", "Unknown error")
+            widgets["optimise_status"].text = _opt_status_html(f"Optimisation failed: {error_msg[:40]}", _STATUS_ERR_STYLE)
+
+    except Exception as apply_error:
+        _opt_log.exception("Applying optimisation result failed")
+        widgets["optimise_status"].text = _opt_status_html(f"Apply error: {str(apply_error)[:40]}", _STATUS_ERR_STYLE)
 
-        finally:
-            widgets["optimise_button"].disabled = False
-            _optimization_running = False
+    finally:
+        widgets["optimise_button"].disabled = False
+        _opt_running.clear()
+        # Held widget-change callbacks fire on unhold, so keep them suppressed until after it
+        doc.unhold()
+        _suppress_callbacks = False
 
 
 # --- Proper widget callback binding to avoid closure issues and use debouncing ---
 def make_callback(widget):
     def callback(attr, old, new):
+        if _suppress_callbacks:
+            return
         debounced_update()
 
     return callback
@@ -2137,26 +2196,15 @@ def run_sensitivity_callback():
     sens_fig_new = plot_sensitivity_heatmap(outputs, config, sensitivity_df)
     sens_plot_container.children[0] = sens_fig_new
     
-    # Update the sensitivity data source for download
-    sens_source.data = ColumnDataSource.from_df(sensitivity_df)
+    # Update the sensitivity data source for download (columns only, no pandas index);
+    # the download includes each row's NPV change from its driver's 0% band
+    base_npv = sensitivity_df[sensitivity_df["Band"] == "0%"].set_index("Driver")["NPV"]
+    sensitivity_df["NPV_Delta"] = sensitivity_df["NPV"] - sensitivity_df["Driver"].map(base_npv)
+    sens_source.data = {col: sensitivity_df[col].to_numpy() for col in sensitivity_df.columns}
 
 
 # Find the button in sens_col and attach callback
-def find_sensitivity_button(layout):
-    """Recursively find the sensitivity analysis button."""
-    if hasattr(layout, 'children'):
-        for child in layout.children:
-            if isinstance(child, Button) and getattr(child, "name", None) == "run_sens_btn":
-                return child
-            elif hasattr(child, 'children'):
-                result = find_sensitivity_button(child)
-                if result:
-                    return result
-    return None
-
-sens_button = find_sensitivity_button(sens_col)
-if sens_button:
-    sens_button.on_click(run_sensitivity_callback)
+run_sens_btn.on_click(run_sensitivity_callback)
 
 # --- Optimization Button Callback ---
 widgets["optimise_button"].on_click(run_optimiser)
@@ -2362,6 +2410,7 @@ dscr_metrics_div.text = render_dscr_metrics(outputs)
 equity_metrics_div.text = render_equity_metrics(outputs)
 get_avg_annual_return("Europe")
 tabs = Tabs(tabs=[main_tab, sens_tab, costing_tab, expert_tab])
+tabs.on_change("active", lambda attr, old, new: _render_costing_if_needed(new))
 
 sidebar_style = {
     "background": "#00375b",
@@ -2400,9 +2449,6 @@ try:
     update_dashboard()
     print("Initial dashboard update completed")
     
-    # Add periodic callback to check for optimization results (runs every 500ms)
-    doc.add_periodic_callback(check_optimization_results, 500)
-    
     print("Dashboard module imported successfully")
     
 except Exception as e:
@@ -28,6 +28,66 @@ SANKEY_COLORS = {
     "Equity Return": "#00b894",  # Teal/Green
 }
 
+# Used when the active document theme defines no palette
+_DEFAULT_PALETTE = (
+    "#007aff",
+    "#00b894",
+    "#222",
+    "#f8f8fa",
+    "#e0e0e0",
+    "#16a085",
+    "#27ae60",
+    "#f39c12",
+    "#e74c3c",
+    "#2980b9",
+)
+
+# Sensitivity heatmap source columns: rect/label positions, colour field, tooltips
+_HEATMAP_COLUMNS = ("Driver", "Band", "NPV_Delta", "Impact_Label", "NPV", "IRR", "LCOE")
+
+
+def _theme_palette():
+    """Return the current document theme's palette, or the module default."""
+    return curdoc().theme._json.get("palette", _DEFAULT_PALETTE)
+
+
+def _phase_spans(years, outputs, config, palette):
+    """
+    Return BoxAnnotation kwargs for the construction, ramp-up, operation and
+    decommissioning phases shared by the cashflow plots.
+    """
+    constr = outputs["years_construction"]
+    ramp = config["ramp_up_years"] if config["ramp_up"] else 0
+    spans = [
+        dict(
+            left=years[0],
+            right=years[constr - 1],
+            fill_alpha=0.15,
+            fill_color=palette[4],
+        )
+    ]
+    if config["ramp_up"]:
+        spans.append(
+            dict(
+                left=years[constr],
+                right=years[constr + ramp - 1],
+                fill_alpha=0.10,
+                fill_color=palette[5],
+            )
+        )
+    spans.append(
+        dict(
+            left=years[constr + ramp],
+            right=years[constr + config["plant_lifetime"] - 2],
+            fill_alpha=0.08,
+            fill_color=palette[6],
+        )
+    )
+    spans.append(
+        dict(left=years[-2], right=years[-1], fill_alpha=0.10, fill_color=palette[7])
+    )
+    return spans
+
 
 def plot_annual_cashflow_bokeh(outputs, config):
     """
@@ -42,34 +102,21 @@ def plot_annual_cashflow_bokeh(outputs, config):
     years = outputs["year_labels_int"]
     unlevered = outputs["unlevered_cf_vec"]
     levered = outputs["levered_cf_vec"]
+    # ndarray columns go over the wire as binary buffers rather than JSON lists
     source = ColumnDataSource(
         data=dict(
-            year=years,
-            unlevered=unlevered,
-            levered=levered,
-            revenue=outputs["revenue_vec"],
-            om=outputs["om_vec"],
-            fuel=outputs["fuel_vec"],
-            tax=outputs["tax_vec"],
-            noi=outputs["noi_vec"],
+            year=np.asarray(years),
+            unlevered=np.asarray(unlevered, dtype=float),
+            levered=np.asarray(levered, dtype=float),
+            revenue=np.asarray(outputs["revenue_vec"], dtype=float),
+            om=np.asarray(outputs["om_vec"], dtype=float),
+            fuel=np.asarray(outputs["fuel_vec"], dtype=float),
+            tax=np.asarray(outputs["tax_vec"], dtype=float),
+            noi=np.asarray(outputs["noi_vec"], dtype=float),
         )
     )
     # Use theme palette or fallback
-    palette = curdoc().theme._json.get(
-        "palette",
-        [
-            "#007aff",
-            "#00b894",
-            "#222",
-            "#f8f8fa",
-            "#e0e0e0",
-            "#16a085",
-            "#27ae60",
-            "#f39c12",
-            "#e74c3c",
-            "#2980b9",
-        ],
-    )
+    palette = _theme_palette()
     p = figure(
         title="Annual Cash Flows",
         x_axis_label="Year",
@@ -119,62 +166,13 @@ def plot_annual_cashflow_bokeh(outputs, config):
     )
     p.add_tools(hover)
     # Phase shading using palette
-    y_min = min(min(unlevered), min(levered))
-    y_max = max(max(unlevered), max(levered))
-    # Construction
-    p.add_layout(
-        BoxAnnotation(
-            left=years[0],
-            right=years[outputs["years_construction"] - 1],
-            fill_alpha=0.15,
-            fill_color=palette[4],
-            line_color=None,
-            line_width=0,
-            bottom=y_min,
-            top=y_max,
-            level="underlay",
-        )
-    )
-    # Ramp-up
-    if config["ramp_up"]:
-        p.add_layout(
-            BoxAnnotation(
-                left=years[outputs["years_construction"]],
-                right=years[
-                    outputs["years_construction"] + config["ramp_up_years"] - 1
-                ],
-                fill_alpha=0.10,
-                fill_color=palette[5],
-                line_color=None,
-                level="underlay",
-            )
-        )
-    # Operation
-    op_start = outputs["years_construction"] + (
-        config["ramp_up_years"] if config["ramp_up"] else 0
-    )
-    op_end = outputs["years_construction"] + config["plant_lifetime"] - 2
-    p.add_layout(
-        BoxAnnotation(
-            left=years[op_start],
-            right=years[op_end],
-            fill_alpha=0.08,
-            fill_color=palette[6],
-            line_color=None,
-            level="underlay",
-        )
-    )
-    # Decommission
-    p.add_layout(
-        BoxAnnotation(
-            left=years[-2],
-            right=years[-1],
-            fill_alpha=0.10,
-            fill_color=palette[7],
-            line_color=None,
-            level="underlay",
-        )
-    )
+    y_min = float(min(np.min(unlevered), np.min(levered)))
+    y_max = float(max(np.max(unlevered), np.max(levered)))
+    spans = _phase_spans(years, outputs, config, palette)
+    # Construction shading is clipped to the plotted cash-flow range
+    spans[0].update(bottom=y_min, top=y_max, line_width=0)
+    for kwargs in spans:
+        p.add_layout(BoxAnnotation(**kwargs, line_color=None, level="underlay"))
     p.legend.location = "top_left"
     p.legend.click_policy = "hide"
     # Format y-axis for big numbers
@@ -191,23 +189,13 @@ def plot_cumulative_cashflow_bokeh(outputs, config):
     cum_levered = outputs["cumulative_levered_cf_vec"]
     payback = outputs["payback"]
     source = ColumnDataSource(
-        data=dict(year=years, cum_unlevered=cum_unlevered, cum_levered=cum_levered)
-    )
-    palette = curdoc().theme._json.get(
-        "palette",
-        [
-            "#007aff",
-            "#00b894",
-            "#222",
-            "#f8f8fa",
-            "#e0e0e0",
-            "#16a085",
-            "#27ae60",
-            "#f39c12",
-            "#e74c3c",
-            "#2980b9",
-        ],
+        data=dict(
+            year=np.asarray(years),
+            cum_unlevered=np.asarray(cum_unlevered, dtype=float),
+            cum_levered=np.asarray(cum_levered, dtype=float),
+        )
     )
+    palette = _theme_palette()
     p = figure(
         title="Cumulative Cash Flows",
         x_axis_label="Year",
@@ -257,55 +245,9 @@ def plot_cumulative_cashflow_bokeh(outputs, config):
     )
     p.add_tools(hover)
     # Phase shading using palette
-    y_min = min(min(cum_unlevered), min(cum_levered))
-    y_max = max(max(cum_unlevered), max(cum_levered))
-    p.add_layout(
-        BoxAnnotation(
-            left=years[0],
-            right=years[outputs["years_construction"] - 1],
-            fill_alpha=0.15,
-            fill_color=palette[4],
-            line_color=None,
-            level="underlay",
-        )
-    )
-    if config["ramp_up"]:
-        p.add_layout(
-            BoxAnnotation(
-                left=years[outputs["years_construction"]],
-                right=years[
-                    outputs["years_construction"] + config["ramp_up_years"] - 1
-                ],
-                fill_alpha=0.10,
-                fill_color=palette[5],
-                line_color=None,
-                level="underlay",
-            )
-        )
-    op_start = outputs["years_construction"] + (
-        config["ramp_up_years"] if config["ramp_up"] else 0
-    )
-    op_end = outputs["years_construction"] + config["plant_lifetime"] - 2
-    p.add_layout(
-        BoxAnnotation(
-            left=years[op_start],
-            right=years[op_end],
-            fill_alpha=0.08,
-            fill_color=palette[6],
-            line_color=None,
-            level="underlay",
-        )
-    )
-    p.add_layout(
-        BoxAnnotation(
-            left=years[-2],
-            right=years[-1],
-            fill_alpha=0.10,
-            fill_color=palette[7],
-            line_color=None,
-            level="underlay",
-        )
-    )
+    y_max = float(max(np.max(cum_unlevered), np.max(cum_levered)))
+    for kwargs in _phase_spans(years, outputs, config, palette):
+        p.add_layout(BoxAnnotation(**kwargs, line_color=None, level="underlay"))
     # Payback marker
     if payback is not None and 0 <= payback < len(years):
         payback_span = Span(
@@ -336,34 +278,21 @@ def plot_dscr_profile_bokeh(outputs, config):
     Create a Bokeh Figure for DSCR Profile (Debt Service Coverage Ratio), with phase shading and DSCR covenant line.
     """
     years = outputs["year_labels_int"]
-    dscr_vec = outputs["dscr_vec"]
-    dscr_masked = [
-        v if (v is not None and v != float("inf") and v < 1e6) else None
-        for v in dscr_vec
-    ]
-    noi = outputs["noi_vec"]
-    debt_service = [
-        a + b
-        for a, b in zip(outputs["principal_paid_vec"], outputs["interest_paid_vec"])
-    ]
+    # None/inf/sentinel values become NaN so the line breaks instead of spiking;
+    # the rest is capped at 5 to keep the y-axis readable
+    dscr_vec = np.asarray(outputs["dscr_vec"], dtype=float)
+    dscr_masked = np.where((dscr_vec != np.inf) & (dscr_vec < 1e6), dscr_vec, np.nan)
+    noi = np.asarray(outputs["noi_vec"], dtype=float)
+    debt_service = np.asarray(outputs["total_debt_service_vec"], dtype=float)
     source = ColumnDataSource(
-        data=dict(year=years, dscr=dscr_masked, noi=noi, debt_service=debt_service)
-    )
-    palette = curdoc().theme._json.get(
-        "palette",
-        [
-            "#007aff",
-            "#00b894",
-            "#222",
-            "#f8f8fa",
-            "#e0e0e0",
-            "#16a085",
-            "#27ae60",
-            "#f39c12",
-            "#e74c3c",
-            "#2980b9",
-        ],
+        data=dict(
+            year=np.asarray(years),
+            dscr=np.clip(dscr_masked, None, 5),
+            noi=noi,
+            debt_service=debt_service,
+        )
     )
+    palette = _theme_palette()
     p = figure(
         title="Debt Service Coverage Ratio (DSCR) Profile",
         x_axis_label="Year",
@@ -377,10 +306,6 @@ def plot_dscr_profile_bokeh(outputs, config):
     p.min_border_right = 0
     p.yaxis.axis_label_standoff = 0
     p.yaxis.formatter = NumeralTickFormatter(format="0,0")
-    # keep the y-axis readable by capping extreme values
-    dscr_arr = np.array(source.data["dscr"], dtype=float)
-    dscr_arr = np.clip(dscr_arr, None, 5)
-    source.data["dscr"] = dscr_arr.tolist()
     if isinstance(p.y_range, Range1d):
         p.y_range.end = 5
     p.line(
@@ -465,18 +390,18 @@ def plot_cashflow_waterfall_bokeh(outputs, config, width=700, height=380):
         -config["total_epc_cost"] * config["process_contingency_pct"],
         -config["total_epc_cost"] * config["financing_fee"],
     ]
-    base = [0]
-    for v in amounts[:-1]:
-        base.append(base[-1] + v)
-    top = [b + v for b, v in zip(base, amounts)]
-    colors = ["#27ae60" if v > 0 else "#e74c3c" for v in amounts]
-    x = list(range(len(labels)))
-    src = ColumnDataSource(dict(x=x, label=labels, base=base, top=top, amt=amounts, color=colors))
+    amt = np.asarray(amounts, dtype=float)
+    base = np.concatenate(([0.0], np.cumsum(amt)[:-1]))
+    top = base + amt
+    colors = np.where(amt > 0, "#27ae60", "#e74c3c").tolist()
+    x = np.arange(len(labels))
+    src = ColumnDataSource(dict(x=x, label=labels, base=base, top=top, amt=amt, color=colors))
     p = figure(x_range=labels, width=width, height=height, title="Project Sources & Uses Waterfall", toolbar_location=None, tools="")
     p.vbar(x='x', top='top', bottom='base', color='color', source=src, width=0.6)
-    # Add connectors between bars using integer indices
-    for i in range(len(labels) - 1):
-        p.segment(x0=i, x1=i+1, y0=top[i], y1=base[i+1], line_color="#7f7f7f", line_width=2)
+    # Add connectors between bars using integer indices, as a single glyph
+    xs = np.column_stack((x[:-1], x[1:])).tolist()
+    ys = np.column_stack((top[:-1], base[1:])).tolist()
+    p.multi_line(xs=xs, ys=ys, line_color="#7f7f7f", line_width=2)
     p.xaxis.major_label_overrides = {i: label for i, label in enumerate(labels)}
     p.yaxis.formatter = NumeralTickFormatter(format="$0.0a")
     p.xgrid.grid_line_color = None
@@ -493,13 +418,12 @@ def plot_sensitivity_bokeh(outputs, config, sensitivity_df):
     from bokeh.transform import dodge
     from bokeh.models import FactorRange
 
-    base_npv = sensitivity_df[sensitivity_df["Scenario"] == "Base"]["NPV"].values[0]
-    base_irr = sensitivity_df[sensitivity_df["Scenario"] == "Base"]["IRR"].values[0]
-    scenarios = sensitivity_df["Scenario"].tolist()[1:]
-    npv_deltas = sensitivity_df["NPV"].tolist()[1:]
-    npv_deltas = [v - base_npv for v in npv_deltas]
-    irr_deltas = sensitivity_df["IRR"].tolist()[1:]
-    irr_deltas = [v - base_irr for v in irr_deltas]
+    is_base = sensitivity_df["Scenario"] == "Base"
+    base_npv = sensitivity_df.loc[is_base, "NPV"].values[0]
+    base_irr = sensitivity_df.loc[is_base, "IRR"].values[0]
+    scenarios = sensitivity_df.loc[~is_base, "Scenario"].tolist()
+    npv_deltas = (sensitivity_df.loc[~is_base, "NPV"] - base_npv).to_numpy()
+    irr_deltas = (sensitivity_df.loc[~is_base, "IRR"] - base_irr).to_numpy()
     src = ColumnDataSource(
         data=dict(scenarios=scenarios, npv=npv_deltas, irr=irr_deltas)
     )
@@ -509,23 +433,10 @@ def plot_sensitivity_bokeh(outputs, config, sensitivity_df):
         title="Sensitivity of NPV and IRR",
         width=800,
         height=350,
-        tools="pan,wheel_zoom,box_zoom,reset,save",
-    )
-    palette = curdoc().theme._json.get(
-        "palette",
-        [
-            "#007aff",
-            "#00b894",
-            "#222",
-            "#f8f8fa",
-            "#e0e0e0",
-            "#16a085",
-            "#27ae60",
-            "#f39c12",
-            "#e74c3c",
-            "#2980b9",
-        ],
+        # Categorical y-axis: pan/zoom add nothing; hover is added below
+        tools="reset,save",
     )
+    palette = _theme_palette()
     p.hbar(
         y=dodge("scenarios", -0.15, range=p.y_range),
         right="npv",
@@ -644,148 +555,6 @@ def plot_sensitivity_bokeh(outputs, config, sensitivity_df):
     return p
 
 
-def _prepare_nodes(outputs):
-    """
-    Assigns x/y, width, color, and label for each node.
-    Returns: nodes (list of dict), links (list of dict), total_inflow (float)
-    """
-    # Calculate values
-    years_construction = outputs["years_construction"]
-    plant_lifetime = outputs["plant_lifetime"]
-    op_slice = slice(years_construction, years_construction + plant_lifetime)
-    revenue = sum(outputs["revenue_vec"][op_slice])
-    om = sum(outputs["om_vec"][op_slice])
-    taxes = sum(outputs["tax_vec"][op_slice])
-    noi = revenue - om - taxes
-    debt_service = sum(
-        [
-            a + b
-            for a, b in zip(
-                outputs["principal_paid_vec"][op_slice],
-                outputs["interest_paid_vec"][op_slice],
-            )
-        ]
-    )
-    interest = sum(outputs["interest_paid_vec"][op_slice])
-    principal = sum(outputs["principal_paid_vec"][op_slice])
-    residual = noi - debt_service
-    equity_return = sum(outputs["equity_cf_vec"][op_slice])
-
-    # Node order and positions
-    palette = curdoc().theme._json.get(
-        "palette", ["#27ae60", "#f39c12", "#e74c3c", "#2980b9", "#8e44ad", "#00b894"]
-    )
-    node_defs = [
-        ("Revenue", 0, 0.5, revenue, palette[0]),
-        ("O&M", 1, 0.8, om, palette[1]),
-        ("Taxes", 1, 0.2, taxes, palette[2]),
-        ("NOI", 2, 0.5, noi, palette[3]),
-        ("Debt Service", 3, 0.5, debt_service, palette[3]),
-        ("Interest", 4, 0.8, interest, palette[4]),
-        ("Principal", 4, 0.2, principal, palette[4]),
-        ("Residual", 5, 0.5, residual, palette[5]),
-        ("Equity Return", 6, 0.5, equity_return, palette[5]),
-    ]
-    nodes = []
-    for name, x, y, value, color in node_defs:
-        label = f"{name}\n${value/1e9:,.1f} B"
-        nodes.append(
-            dict(
-                name=name, x=x, y=y, value=value, color=color, label=label, w=0.7, h=30
-            )
-        )
-    # Links: source, target, value, color
-    links = [
-        dict(source="Revenue", target="O&M", value=om, color=palette[1]),
-        dict(source="O&M", target="Taxes", value=taxes, color=palette[2]),
-        dict(source="Taxes", target="NOI", value=noi, color=palette[3]),
-        dict(source="NOI", target="Debt Service", value=debt_service, color=palette[3]),
-        dict(
-            source="Debt Service", target="Interest", value=interest, color=palette[4]
-        ),
-        dict(
-            source="Debt Service", target="Principal", value=principal, color=palette[4]
-        ),
-        dict(source="NOI", target="Residual", value=residual, color=palette[5]),
-        dict(
-            source="Residual",
-            target="Equity Return",
-            value=equity_return,
-            color=palette[5],
-        ),
-    ]
-    total_inflow = revenue
-    return nodes, links, total_inflow
-
-
-def _prepare_links(nodes, links, total_inflow):
-    """
-    Computes stacking offsets for each source-target, and percent of total.
-    Returns: updated links with y0/y1 offsets and percent.
-    """
-    # For each stage, stack outgoing links
-    node_map = {n["name"]: n for n in nodes}
-    stage_links = {}
-    for l in links:
-        stage_links.setdefault(l["source"], []).append(l)
-    # For each source, assign y0/y1 offsets for stacking
-    for src, out_links in stage_links.items():
-        y = node_map[src]["y"]
-        total = sum(l["value"] for l in out_links)
-        offset = y - 0.5 * (total / total_inflow)
-        for l in out_links:
-            l["y0"] = offset + 0.5 * l["value"] / total_inflow
-            offset += l["value"] / total_inflow
-            l["percent"] = l["value"] / total_inflow
-    # For each target, assign y1
-    for l in links:
-        l["y1"] = node_map[l["target"]]["y"]
-    return links
-
-
-def _build_patches(nodes, links, scale):
-    """
-    For each link, builds a smooth 4–6-point patch (polygon) for the ribbon.
-    Returns: lists for xs, ys, colors, labels, percents, values, sources, targets.
-    """
-    node_map = {n["name"]: n for n in nodes}
-    xs, ys, colors, labels, percents, values, sources, targets = (
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-    )
-    for l in links:
-        x0 = node_map[l["source"]]["x"] + 0.35
-        x1 = node_map[l["target"]]["x"] - 0.35
-        y0 = l["y0"] * scale * 1.5 * 450  # scale to canvas
-        y1 = l["y1"] * scale * 1.5 * 450
-        thickness = l["value"] * scale
-        # Top and bottom y
-        y0_top = y0 + 0.5 * thickness
-        y0_bot = y0 - 0.5 * thickness
-        y1_top = y1 + 0.5 * thickness
-        y1_bot = y1 - 0.5 * thickness
-        # Smooth curve: control points
-        ctrl_x = (x0 + x1) / 2
-        # 6-point patch for smoothness
-        xs_patch = [x0, ctrl_x, x1, x1, ctrl_x, x0]
-        ys_patch = [y0_top, y0_top, y1_top, y1_bot, y0_bot, y0_bot]
-        xs.append(xs_patch)
-        ys.append(ys_patch)
-        colors.append(l["color"])
-        labels.append(f"${l['value']/1e9:,.1f} B")
-        percents.append(l["percent"])
-        values.append(l["value"])
-        sources.append(l["source"])
-        targets.append(l["target"])
-    return xs, ys, colors, labels, percents, values, sources, targets
-
-
 def plot_sensitivity_heatmap(outputs, config, sensitivity_df):
     """
     Create a clean, focused Bokeh heatmap showing NPV impact only.
@@ -804,14 +573,13 @@ def plot_sensitivity_heatmap(outputs, config, sensitivity_df):
     from bokeh.palettes import RdYlGn
     import pandas as pd
 
-    # Calculate NPV deltas (impact relative to base case)
+    # Create a clean copy to avoid modifying the original
+    heatmap_df = sensitivity_df.copy()
+
+    # Calculate NPV deltas (impact relative to each driver's 0% band)
     base_npv = sensitivity_df[sensitivity_df["Band"] == "0%"].set_index("Driver")["NPV"]
-    
-    def calculate_npv_delta(row):
-        return row["NPV"] - base_npv[row["Driver"]]
-    
-    sensitivity_df["NPV_Delta"] = sensitivity_df.apply(calculate_npv_delta, axis=1)
-    
+    heatmap_df["NPV_Delta"] = heatmap_df["NPV"] - heatmap_df["Driver"].map(base_npv)
+
     # Create clean labels for the cells - fix the formatting issue
     def format_impact(delta):
         if delta == 0:
@@ -825,23 +593,20 @@ def plot_sensitivity_heatmap(outputs, config, sensitivity_df):
         else:
             return f"${delta:+0.0f}"
     
-    # Create a clean copy to avoid modifying the original
-    heatmap_df = sensitivity_df.copy()
     heatmap_df["Impact_Label"] = heatmap_df["NPV_Delta"].apply(format_impact)
     
     # Prepare categorical axes
     drivers = list(heatmap_df["Driver"].unique())
     
-    # Sort bands numerically
-    def band_sort_key(b):
-        try:
-            return int(b.replace("%", "").replace("+", ""))
-        except:
-            return 0
-    bands = sorted(heatmap_df["Band"].unique(), key=band_sort_key)
+    # Sort bands numerically ("-20%" ... "+20%"); unparseable labels sort as 0
+    band_labels = pd.Series(heatmap_df["Band"].unique())
+    band_pct = pd.to_numeric(band_labels.str.rstrip("%"), errors="coerce").fillna(0)
+    bands = band_labels.iloc[np.argsort(band_pct.to_numpy(), kind="stable")].tolist()
     
-    # Create Bokeh data source
-    source = ColumnDataSource(heatmap_df)
+    # Create Bokeh data source with only the columns the glyphs and tooltips use
+    source = ColumnDataSource(
+        {col: heatmap_df[col].to_numpy() for col in _HEATMAP_COLUMNS}
+    )
     
     # Color mapping: Red for negative impact, Green for positive impact
     from bokeh.palettes import RdYlGn
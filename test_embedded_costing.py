@@ -3,11 +3,11 @@ Test embedded costing calculations
 Tests the internal costing module without PyFECONS dependency
 """
 import pytest
-from src.fusion_cashflow.costing import compute_total_epc_cost
 
 
 def test_mfe_tokamak_basic():
     """Test basic MFE tokamak costing calculation"""
+    from src.fusion_cashflow.costing import compute_total_epc_cost
     config = {
         "reactor_type": "MFE",
         "confinement_type": "tokamak",
@@ -86,6 +86,7 @@ def test_mfe_tokamak_basic():
 
 def test_ife_basic():
     """Test basic IFE costing calculation"""
+    from src.fusion_cashflow.costing import compute_total_epc_cost
     config = {
         "reactor_type": "IFE",
         "confinement_type": "laser",
@@ -134,6 +135,7 @@ def test_ife_basic():
 
 def test_power_scaling():
     """Test that costs scale reasonably with power"""
+    from src.fusion_cashflow.costing import compute_total_epc_cost
     base_config = {
         "reactor_type": "MFE",
         "fuel_type": "DT",
@@ -164,9 +166,21 @@ def test_power_scaling():
     print(f"   Cost ratio: {cost_ratio:.2f}x (should be 1.0-2.0x)")
 
 
+def test_reactor_type_mapping():
+    """Test that the legacy 'tokamak' code maps to MFE tokamak, as unknown types always did"""
+    from src.fusion_cashflow.costing.adapter import _config_to_costing_data
+    from src.fusion_cashflow.costing.enums_new import ReactorType
+
+    for code in ("tokamak", "MFE", "not-a-reactor"):
+        data = _config_to_costing_data({"reactor_type": code})
+        assert data.basic.reactor_type == ReactorType.MFE_TOKAMAK, code
+    assert _config_to_costing_data({"reactor_type": "IFE"}).basic.reactor_type == ReactorType.IFE_LASER
+
+
 if __name__ == "__main__":
     print("Testing embedded costing calculations...\n")
     test_mfe_tokamak_basic()
     test_ife_basic()
     test_power_scaling()
+    test_reactor_type_mapping()
     print("\n✅ All tests passed!")
@@ -1,4 +1,12 @@
-"""Comprehensive audit of all 7 LCOE vector inputs."""
+"""Comprehensive audit of all 7 LCOE vector inputs.
+
+Set AUDIT_QUIET=1 to print only the HEALTH CHECK section (e.g. under CI).
+"""
+import io
+import os
+import sys
+
+import numpy as np
 from fusion_cashflow.core.cashflow_engine import get_default_config, run_cashflow_scenario
 
 config = get_default_config()
@@ -23,16 +31,56 @@ config.update({
     "noak": True,
 })
 
+QUIET = bool(os.environ.get("AUDIT_QUIET"))
+SEP = "=" * 70
+
+# Fixed report sections, each written with a single format + write
+HEADER_TEMPLATE = """{sep}
+LCOE INPUT VECTOR AUDIT
+{sep}
+LCOE:              ${lcoe_val:.2f}/MWh
+Discount rate:     {discount_pct:.2f}% (WACC)
+Plant lifetime:    {plant_lifetime} years
+Construction:      {years_construction} years
+"""
+
+CAPEX_TEMPLATE = """
+1. CAPEX (construction period)
+   Total EPC:      ${epc_b:.3f}B
+   TOC (w/ IDC):   ${toc_b:.3f}B
+   Source:          Costing CAS 10-40 (geometry+physics)
+"""
+
+DECOM_TEMPLATE = """
+4. DECOMMISSIONING
+   Decom cost:     ${decom_b:.2f}B
+   Decom year:     {decom_year}
+   Source:          Config (% of EPC could be better)
+"""
+
+DISCOUNT_TEMPLATE = """
+7. DISCOUNT RATE
+   WACC:           {wacc_pct:.2f}%
+   CoE:            {coe_pct:.2f}%
+   CoD:            {cod_pct:.2f}%
+   Equity%:        {equity_pct:.0f}%
+   Source:          CAPM (region={region})
+"""
+
 result = run_cashflow_scenario(config)
 
-SEP = "=" * 70
-print(SEP)
-print("LCOE INPUT VECTOR AUDIT")
-print(SEP)
-print(f"LCOE:              ${result['lcoe_val']:.2f}/MWh")
-print(f"Discount rate:     {result['discount_rate']*100:.2f}% (WACC)")
-print(f"Plant lifetime:    {result['plant_lifetime']} years")
-print(f"Construction:      {result['years_construction']} years")
+# Build the whole report in memory and write it to stdout once at the end
+buf = io.StringIO()
+w = buf.write
+
+if not QUIET:
+    w(HEADER_TEMPLATE.format(
+        sep=SEP,
+        lcoe_val=result['lcoe_val'],
+        discount_pct=result['discount_rate'] * 100,
+        plant_lifetime=result['plant_lifetime'],
+        years_construction=result['years_construction'],
+    ))
 
 epc = result.get("epc_breakdown", {})
 pb = epc.get("power_balance", {})
@@ -42,123 +90,131 @@ costing_fuel = epc.get("costing_annual_fuel_cost", 0)
 n = len(result['energy_vec'])
 yc = result['years_construction']
 
+# Engine vectors are lists; convert once so the summaries below slice and mask arrays
+om = np.asarray(result['om_vec'], dtype=float)
+fuel = np.asarray(result['fuel_vec'], dtype=float)
+energy = np.asarray(result['energy_vec'], dtype=float)
+tax = np.asarray(result['tax_vec'], dtype=float)
+
 # 1. CAPEX
-print(f"\n1. CAPEX (construction period)")
-print(f"   Total EPC:      ${result['total_epc_cost']/1e9:.3f}B")
-print(f"   TOC (w/ IDC):   ${result['toc']/1e9:.3f}B")
-print(f"   Source:          Costing CAS 10-40 (geometry+physics)")
+if not QUIET:
+    w(CAPEX_TEMPLATE.format(epc_b=result['total_epc_cost'] / 1e9, toc_b=result['toc'] / 1e9))
 
 # 2. OPEX (om_vec in result = fixed_om + variable_om per year)
-om = result['om_vec']
-op_om = om[yc:] if len(om) > yc else []
-print(f"\n2. OPEX (O&M vector)")
-if op_om:
-    print(f"   Year 1 O&M:     ${op_om[0]/1e6:.1f}M")
-    print(f"   Steady-state:   ${op_om[-1]/1e6:.1f}M")
-    print(f"   Fixed O&M/MW:   ${costing_om:,.0f}/MW/yr  (CAS 70 / P_net)")
-    print(f"   P_net:          {p_net:.1f} MW")
-    print(f"   Expected base:  ${costing_om * p_net / 1e6:.1f}M/yr")
-    print(f"   Source:          CAS 70 annualized O&M (physics-based)")
+op_om = om[yc:]
+if not QUIET:
+    w(f"\n2. OPEX (O&M vector)\n")
+    if op_om.size:
+        w(f"   Year 1 O&M:     ${op_om[0]/1e6:.1f}M\n")
+        w(f"   Steady-state:   ${op_om[-1]/1e6:.1f}M\n")
+        w(f"   Fixed O&M/MW:   ${costing_om:,.0f}/MW/yr  (CAS 70 / P_net)\n")
+        w(f"   P_net:          {p_net:.1f} MW\n")
+        w(f"   Expected base:  ${costing_om * p_net / 1e6:.1f}M/yr\n")
+        w(f"   Source:          CAS 70 annualized O&M (physics-based)\n")
 
 # 3. FUEL (fuel_vec in result)
-fuel = result['fuel_vec']
-op_fuel = fuel[yc:] if len(fuel) > yc else []
-print(f"\n3. FUEL VECTOR")
-if op_fuel and any(f > 0 for f in op_fuel):
-    print(f"   Year 1 fuel:    ${op_fuel[0]/1e6:.3f}M")
-    print(f"   Steady-state:   ${op_fuel[-1]/1e6:.3f}M")
-    print(f"   CAS 80 base:    ${costing_fuel/1e6:.3f}M/yr")
-    print(f"   Source:          CAS 80 (costing-derived fuel cost)")
-else:
-    print(f"   Fuel costs:     $0 (check CAS 80)")
+op_fuel = fuel[yc:]
+if not QUIET:
+    w(f"\n3. FUEL VECTOR\n")
+    if (op_fuel > 0).any():
+        w(f"   Year 1 fuel:    ${op_fuel[0]/1e6:.3f}M\n")
+        w(f"   Steady-state:   ${op_fuel[-1]/1e6:.3f}M\n")
+        w(f"   CAS 80 base:    ${costing_fuel/1e6:.3f}M/yr\n")
+        w(f"   Source:          CAS 80 (costing-derived fuel cost)\n")
+    else:
+        w(f"   Fuel costs:     $0 (check CAS 80)\n")
 
 # 4. DECOMMISSIONING
-print(f"\n4. DECOMMISSIONING")
 decom_cost = config.get("decommissioning_cost", 0)
-print(f"   Decom cost:     ${decom_cost/1e9:.2f}B")
-print(f"   Decom year:     {result.get('decommissioning_year', 'N/A')}")
-print(f"   Source:          Config (% of EPC could be better)")
+if not QUIET:
+    w(DECOM_TEMPLATE.format(
+        decom_b=decom_cost / 1e9, decom_year=result.get('decommissioning_year', 'N/A'),
+    ))
 
 # 5. ENERGY
-energy = result['energy_vec']
-op_energy = [v for v in energy if v > 0]
+op_energy = energy[energy > 0]
 cf = config.get("capacity_factor", 0.92)
 expected_mwh = p_net * 8760 * cf
-print(f"\n5. ENERGY VECTOR")
-if op_energy:
-    print(f"   Year 1 energy:  {op_energy[0]:,.0f} MWh")
-    print(f"   Steady-state:   {op_energy[-1]:,.0f} MWh")
-    print(f"   Expected:       {expected_mwh:,.0f} MWh")
-    print(f"   Match:          {'YES' if abs(op_energy[-1] - expected_mwh)/expected_mwh < 0.01 else 'NO'}")
-    print(f"   Source:          P_net (costing physics) x 8760h x CF={cf}")
+if not QUIET:
+    w(f"\n5. ENERGY VECTOR\n")
+    if op_energy.size:
+        w(f"   Year 1 energy:  {op_energy[0]:,.0f} MWh\n")
+        w(f"   Steady-state:   {op_energy[-1]:,.0f} MWh\n")
+        w(f"   Expected:       {expected_mwh:,.0f} MWh\n")
+        w(f"   Match:          {'YES' if abs(op_energy[-1] - expected_mwh)/expected_mwh < 0.01 else 'NO'}\n")
+        w(f"   Source:          P_net (costing physics) x 8760h x CF={cf}\n")
 
 # 6. TAX
-tax = result['tax_vec']
-op_tax = [v for v in tax if v > 0]
-print(f"\n6. TAX VECTOR")
-if op_tax:
-    print(f"   Year 1 tax:     ${op_tax[0]/1e6:.1f}M")
-    print(f"   Avg annual:     ${sum(op_tax)/len(op_tax)/1e6:.1f}M")
-    print(f"   Tax rate:       {result['tax_rate']*100:.1f}%")
-    print(f"   Source:          max(0, profit - depreciation) x tax_rate")
+op_tax = tax[tax > 0]
+if not QUIET:
+    w(f"\n6. TAX VECTOR\n")
+    if op_tax.size:
+        w(f"   Year 1 tax:     ${op_tax[0]/1e6:.1f}M\n")
+        w(f"   Avg annual:     ${op_tax.mean()/1e6:.1f}M\n")
+        w(f"   Tax rate:       {result['tax_rate']*100:.1f}%\n")
+        w(f"   Source:          max(0, profit - depreciation) x tax_rate\n")
 
 # 7. DISCOUNT RATE
-print(f"\n7. DISCOUNT RATE")
-print(f"   WACC:           {result['discount_rate']*100:.2f}%")
-print(f"   CoE:            {result['cost_of_equity']*100:.2f}%")
-print(f"   CoD:            {result['cost_of_debt']*100:.2f}%")
-print(f"   Equity%:        {result['input_equity_pct']*100:.0f}%")
-print(f"   Source:          CAPM (region={result['region']})")
+if not QUIET:
+    w(DISCOUNT_TEMPLATE.format(
+        wacc_pct=result['discount_rate'] * 100,
+        coe_pct=result['cost_of_equity'] * 100,
+        cod_pct=result['cost_of_debt'] * 100,
+        equity_pct=result['input_equity_pct'] * 100,
+        region=result['region'],
+    ))
 
 # HEALTH CHECK
-print(f"\n{SEP}")
-print("HEALTH CHECK")
-print(SEP)
+w(f"\n{SEP}\n")
+w("HEALTH CHECK\n")
+w(SEP + "\n")
 issues = []
 
 if abs(result['total_epc_cost'] - 5_000_000_000) < 1:
     issues.append("FAIL: EPC is default $5B — costing module failed!")
 else:
-    print(f"  [OK] EPC from costing: ${result['total_epc_cost']/1e9:.3f}B")
+    w(f"  [OK] EPC from costing: ${result['total_epc_cost']/1e9:.3f}B\n")
 
 if p_net > 0:
-    print(f"  [OK] P_net = {p_net:.1f} MW (physics-derived)")
+    w(f"  [OK] P_net = {p_net:.1f} MW (physics-derived)\n")
 else:
     issues.append("FAIL: P_net = 0")
 
 if costing_om > 0:
-    print(f"  [OK] O&M from CAS 70: ${costing_om:,.0f}/MW/yr")
+    w(f"  [OK] O&M from CAS 70: ${costing_om:,.0f}/MW/yr\n")
 else:
     issues.append("WARN: No CAS 70 O&M")
 
 if costing_fuel > 0:
-    print(f"  [OK] Fuel from CAS 80: ${costing_fuel/1e6:.3f}M/yr")
+    w(f"  [OK] Fuel from CAS 80: ${costing_fuel/1e6:.3f}M/yr\n")
 else:
     issues.append("WARN: No CAS 80 fuel cost")
 
-if op_energy and expected_mwh > 0 and abs(op_energy[-1] - expected_mwh)/expected_mwh < 0.01:
-    print(f"  [OK] Energy consistent: {op_energy[-1]:,.0f} MWh")
+if op_energy.size and expected_mwh > 0 and abs(op_energy[-1] - expected_mwh)/expected_mwh < 0.01:
+    w(f"  [OK] Energy consistent: {op_energy[-1]:,.0f} MWh\n")
 else:
     issues.append(f"WARN: Energy mismatch")
 
 lcoe = result['lcoe_val']
 if 20 < lcoe < 500:
-    print(f"  [OK] LCOE ${lcoe:.2f}/MWh in reasonable range")
+    w(f"  [OK] LCOE ${lcoe:.2f}/MWh in reasonable range\n")
 else:
     issues.append(f"WARN: LCOE ${lcoe:.2f}/MWh outside expected range")
 
 # Check decom is reasonable
 if 0 < decom_cost < result['total_epc_cost']:
-    print(f"  [OK] Decom ${decom_cost/1e9:.2f}B < EPC")
+    w(f"  [OK] Decom ${decom_cost/1e9:.2f}B < EPC\n")
 elif decom_cost == 0:
     issues.append("WARN: No decommissioning cost set")
 else:
     issues.append(f"WARN: Decom (${decom_cost/1e9:.2f}B) seems high")
 
 if issues:
-    print(f"\nISSUES ({len(issues)}):")
+    w(f"\nISSUES ({len(issues)}):\n")
     for i in issues:
-        print(f"  {i}")
+        w(f"  {i}\n")
 else:
-    print("\n  ALL CHECKS PASSED")
-print(SEP)
+    w("\n  ALL CHECKS PASSED\n")
+w(SEP + "\n")
+
+sys.stdout.write(buf.getvalue())
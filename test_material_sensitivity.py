@@ -1,5 +1,5 @@
 """Test if changing materials affects estimated costs"""
-from src.fusion_cashflow.costing import compute_total_epc_cost
+from src.fusion_cashflow.costing import compute_total_epc_cost_batch
 
 base_config = {
     'thermal_power_mw': 2000,
@@ -22,36 +22,32 @@ blanket_materials = ['lithium orthosilicate', 'lithium', 'liquid lithium', 'flib
 print("=== Testing Blanket Material Changes ===\n")
 
 results = []
-for mat in blanket_materials:
-    config = base_config.copy()
-    config['blanket_material'] = mat
-    config['shield_material'] = 'stainless steel'  # Keep constant
-    
-    try:
-        result = compute_total_epc_cost(config)
-        blanket_cost = result.get('blanket', 0)
-        total_mat = result.get('firstwall', 0) + blanket_cost + result.get('shield', 0)
-        results.append((mat, blanket_cost, total_mat))
-        print(f"{mat:25s} → Blanket: ${blanket_cost:6.1f}M  Total: ${total_mat:6.1f}M")
-    except Exception as e:
-        print(f"{mat:25s} → ERROR: {e}")
+# Shield material kept constant across the blanket sweep
+sweep = compute_total_epc_cost_batch({**base_config, 'shield_material': 'stainless steel'},
+                                     'blanket_material', blanket_materials)
+for mat, result in zip(blanket_materials, sweep):
+    if 'error' in result:
+        print(f"{mat:25s} → ERROR: {result['error']}")
+        continue
+    blanket_cost = result.get('blanket', 0)
+    total_mat = result.get('firstwall', 0) + blanket_cost + result.get('shield', 0)
+    results.append((mat, blanket_cost, total_mat))
+    print(f"{mat:25s} → Blanket: ${blanket_cost:6.1f}M  Total: ${total_mat:6.1f}M")
 
 # Test different structure materials
 structure_materials = ['stainless steel', 'ferritic steel', 'inconel', 'vanadium']
 print("\n=== Testing Structure Material Changes ===\n")
 
-for mat in structure_materials:
-    config = base_config.copy()
-    config['blanket_material'] = 'lithium orthosilicate'  # Keep constant
-    config['shield_material'] = mat
-    
-    try:
-        result = compute_total_epc_cost(config)
-        shield_cost = result.get('shield', 0)
-        total_mat = result.get('firstwall', 0) + result.get('blanket', 0) + shield_cost
-        print(f"{mat:25s} → Shield: ${shield_cost:6.1f}M  Total: ${total_mat:6.1f}M")
-    except Exception as e:
-        print(f"{mat:25s} → ERROR: {e}")
+# Blanket material kept constant across the structure sweep
+sweep = compute_total_epc_cost_batch({**base_config, 'blanket_material': 'lithium orthosilicate'},
+                                     'shield_material', structure_materials)
+for mat, result in zip(structure_materials, sweep):
+    if 'error' in result:
+        print(f"{mat:25s} → ERROR: {result['error']}")
+        continue
+    shield_cost = result.get('shield', 0)
+    total_mat = result.get('firstwall', 0) + result.get('blanket', 0) + shield_cost
+    print(f"{mat:25s} → Shield: ${shield_cost:6.1f}M  Total: ${total_mat:6.1f}M")
 
 # Check if costs changed
 if len(results) > 1:
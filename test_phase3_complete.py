@@ -5,43 +5,57 @@ Validates:
 - IFE: laser driver costing and target factory costing  
 - Q_eng calculations for both MFE and IFE
 """
+from types import MappingProxyType
 
-from fusion_cashflow.costing.adapter import compute_total_epc_cost
+# Shared reactor templates; tests 1 and 2 add detail on top of these
+_BASE_MFE = MappingProxyType({
+    "reactor_type": "MFE Tokamak",
+    "fuel_type": "DT",
+    "plasma_power": 450.0,
+    "thermal_power": 2000.0,
+    "q_plasma": 10.0,
+    # Geometry (large tokamak)
+    "major_radius": 6.2,
+    "minor_radius": 2.0,
+    "blanket_thickness": 0.85,
+    "shield_thickness": 0.75,
+    "blanket_type": "Solid Breeder (Li2TiO3)",
+    "structure_material": "Ferritic Steel (FMS)",
+    "magnet_type": "HTS",
+})
 
+_BASE_IFE = MappingProxyType({
+    "reactor_type": "IFE Laser",
+    "fuel_type": "DT",
+    "plasma_power": 450.0,
+    "thermal_power": 2000.0,
+    "target_yield_mj": 500.0,      # 500 MJ per shot
+    "rep_rate_hz": 10.0,           # 10 Hz repetition
+    "driver_efficiency": 0.10,     # 10% driver efficiency
+    # Geometry (spherical chamber)
+    "chamber_radius": 8.0,
+    "blanket_thickness": 0.85,
+    "shield_thickness": 0.75,
+    "blanket_type": "Liquid Lithium Lead (PbLi)",
+    "structure_material": "Ferritic Steel (FMS)",
+    "magnet_type": "Copper",  # Placeholder (not used in IFE)
+})
 
 def test_mfe_detailed_power_balance():
     """Test MFE with detailed recirculating power components."""
+    from fusion_cashflow.costing.adapter import compute_total_epc_cost
     print("\n" + "="*70)
     print("TEST 1: MFE Detailed Power Balance (Tokamak with HTS magnets)")
     print("="*70)
     
     config = {
-        # Reactor
-        "reactor_type": "MFE Tokamak",
-        "fuel_type": "DT",
-        
-        # Power balance
-        "plasma_power": 450.0,
-        "thermal_power": 2000.0,
-        "q_plasma": 10.0,
+        **_BASE_MFE,
         "neutron_multiplication": 1.15,
         "thermal_efficiency": 0.40,
-        
-        # Geometry (large tokamak)
-        "major_radius": 6.2,
-        "minor_radius": 2.0,
         "plasma_height": 4.0,
-        "blanket_thickness": 0.85,
-        "shield_thickness": 0.75,
         "first_wall_thickness": 0.01,
-        
-        # Materials
-        "blanket_type": "Solid Breeder (Li2TiO3)",
-        "structure_material": "Ferritic Steel (FMS)",
         "first_wall_material": "Tungsten (W)",
-        
         # Magnets - HTS for high magnet power
-        "magnet_type": "HTS",
         "toroidal_field_coil_current": 50.0,
     }
     
@@ -97,37 +111,17 @@ def test_mfe_detailed_power_balance():
 
 def test_ife_detailed_calculations():
     """Test IFE with laser driver and target factory costing."""
+    from fusion_cashflow.costing.adapter import compute_total_epc_cost
     print("\n" + "="*70)
     print("TEST 2: IFE Detailed Calculations (Laser Fusion)")
     print("="*70)
     
     config = {
-        # Reactor
-        "reactor_type": "IFE Laser",
-        "fuel_type": "DT",
-        
-        # Power balance - IFE specific
-        "plasma_power": 450.0,
-        "thermal_power": 2000.0,
-        "target_yield_mj": 500.0,      # 500 MJ per shot
-        "rep_rate_hz": 10.0,           # 10 Hz repetition
-        "driver_efficiency": 0.10,     # 10% driver efficiency
+        **_BASE_IFE,
         "neutron_multiplication": 1.15,
         "thermal_efficiency": 0.40,
-        
-        # Geometry (spherical chamber)
-        "chamber_radius": 8.0,
-        "blanket_thickness": 0.85,
-        "shield_thickness": 0.75,
         "first_wall_thickness": 0.01,
-        
-        # Materials
-        "blanket_type": "Liquid Lithium Lead (PbLi)",
-        "structure_material": "Ferritic Steel (FMS)",
         "first_wall_material": "Tungsten (W)",
-        
-        # No magnets in IFE
-        "magnet_type": "Copper",  # Placeholder (not used)
     }
     
     result = compute_total_epc_cost(config)
@@ -177,44 +171,18 @@ def test_ife_detailed_calculations():
 
 def test_mfe_vs_ife_comparison():
     """Compare MFE vs IFE at same thermal power."""
+    from fusion_cashflow.costing.adapter import compute_total_epc_cost
     print("\n" + "="*70)
     print("TEST 3: MFE vs IFE Comparison (same P_thermal)")
     print("="*70)
     
     # Run MFE tokamak
-    mfe_config = {
-        "reactor_type": "MFE Tokamak",
-        "fuel_type": "DT",
-        "plasma_power": 450.0,
-        "thermal_power": 2000.0,
-        "q_plasma": 10.0,
-        "major_radius": 6.2,
-        "minor_radius": 2.0,
-        "blanket_thickness": 0.85,
-        "shield_thickness": 0.75,
-        "blanket_type": "Solid Breeder (Li2TiO3)",
-        "structure_material": "Ferritic Steel (FMS)",
-        "magnet_type": "HTS",
-    }
+    mfe_config = dict(_BASE_MFE)
     
     mfe_result = compute_total_epc_cost(mfe_config)
     
     # Run IFE laser
-    ife_config = {
-        "reactor_type": "IFE Laser",
-        "fuel_type": "DT",
-        "plasma_power": 450.0,
-        "thermal_power": 2000.0,
-        "target_yield_mj": 500.0,
-        "rep_rate_hz": 10.0,
-        "driver_efficiency": 0.10,
-        "chamber_radius": 8.0,
-        "blanket_thickness": 0.85,
-        "shield_thickness": 0.75,
-        "blanket_type": "Liquid Lithium Lead (PbLi)",
-        "structure_material": "Ferritic Steel (FMS)",
-        "magnet_type": "Copper",
-    }
+    ife_config = dict(_BASE_IFE)
     
     ife_result = compute_total_epc_cost(ife_config)
     
@@ -1,5 +1,5 @@
 """Test Phase 3.1: Detailed magnet costing with HTS/LTS sensitivity."""
-from src.fusion_cashflow.costing import compute_total_epc_cost
+from src.fusion_cashflow.costing import compute_total_epc_cost_batch
 
 base_config = {
     'thermal_power_mw': 2000,
@@ -27,11 +27,11 @@ print("=" * 80)
 magnet_types = ['HTS', 'LTS', 'Copper']
 results = []
 
-for mag_type in magnet_types:
-    config = base_config.copy()
-    config['magnet_type'] = mag_type
-    
-    result = compute_total_epc_cost(config)
+sweep = compute_total_epc_cost_batch(base_config, 'magnet_type', magnet_types)
+for mag_type, result in zip(magnet_types, sweep):
+    if 'error' in result:
+        print(f"\n{mag_type:10s} magnets: ERROR: {result['error']}")
+        continue
     magnet_cost = result.get('cas_2203', 0)
     total_epc = result.get('total_epc_cost', 0)
     magnet_pct = (magnet_cost / total_epc * 100) if total_epc > 0 else 0
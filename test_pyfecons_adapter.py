@@ -7,10 +7,11 @@ This script tests that the adapter successfully:
 3. Returns expected output keys
 """
 import sys
-import os
+from pathlib import Path
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+SRC = str(Path(__file__).resolve().parent / 'src')
+sys.path.insert(0, SRC)
 
 try:
     # Direct import to avoid loading full package (which has missing deps)
@@ -2,16 +2,39 @@
 """
 Quick verification script to test AWS deployment fixes.
 Run this before deploying to AWS Lightsail.
+Pass --fast to skip the (slow) dashboard import check.
 """
 
+import contextlib
+import importlib.util
+import io
 import sys
 import os
 
+_SRC = os.path.join(os.path.dirname(__file__), "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+_SEP = "=" * 60   # section rule
+_HSEP = "=" * 58  # banner rule (inside the box corners)
+
+
+@contextlib.contextmanager
+def _buffered_stdout():
+    """Collect prints in memory and write them to the real stdout in one call."""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
 def test_imports():
     """Test that all required modules can be imported."""
-    print("=" * 60)
+    print(_SEP)
     print("Testing Module Imports")
-    print("=" * 60)
+    print(_SEP)
     
     required_modules = [
         "bokeh",
@@ -30,21 +53,25 @@ def test_imports():
     
     failed = []
     
+    # Required modules are really imported: an installed package that breaks
+    # on import must fail here, since --fast skips the dashboard import
     for module in required_modules:
         try:
             __import__(module)
             print(f"✅ {module}")
-        except ImportError as e:
+        except Exception as e:
             print(f"❌ {module}: {e}")
             failed.append(module)
     
+    # Optional modules are only located; a missing one just disables features
+    missing_optional = [m for m in optional_modules if importlib.util.find_spec(m) is None]
+    
     print("\nOptional modules:")
     for module in optional_modules:
-        try:
-            __import__(module)
-            print(f"✅ {module}")
-        except ImportError:
+        if module in missing_optional:
             print(f"⚠️  {module} (optional - optimization features disabled)")
+        else:
+            print(f"✅ {module}")
     
     if failed:
         print(f"\n❌ FAILED: Missing required modules: {', '.join(failed)}")
@@ -57,14 +84,16 @@ def test_imports():
 
 def test_dashboard_import():
     """Test that dashboard module can be imported without crashes."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Testing Dashboard Module")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        # Add src to path
-        src_path = os.path.join(os.path.dirname(__file__), "src")
-        sys.path.insert(0, src_path)
+        # Fail with a clear message if the module file is missing, before
+        # paying for the dashboard's Bokeh/HoloViews import
+        if importlib.util.find_spec("fusion_cashflow.ui.dashboard") is None:
+            print("❌ Dashboard module not found (fusion_cashflow.ui.dashboard)")
+            return False
         
         # This should not crash even without nevergrad
         from fusion_cashflow.ui import dashboard
@@ -87,38 +116,33 @@ def test_dashboard_import():
 
 def test_websocket_config():
     """Test WebSocket origin configuration."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Testing WebSocket Configuration")
-    print("=" * 60)
-    
-    # Test default (wildcard)
-    os.environ.pop('BOKEH_ALLOW_WS_ORIGIN', None)
-    import run_dashboard_with_static
-    from importlib import reload
-    reload(run_dashboard_with_static)
+    print(_SEP)
     
-    # Just check the file was updated correctly
-    with open('run_dashboard_with_static.py', 'r') as f:
+    # Static check of the launcher source; importing it would pull in the Bokeh server
+    with open(os.path.join(os.path.dirname(__file__), 'run_dashboard_with_static.py'), 'rb') as f:
         content = f.read()
-        if 'BOKEH_ALLOW_WS_ORIGIN' in content and "allowed_origins" in content:
-            print("✅ WebSocket origin configuration updated")
-            print("   - Default: Accept all origins (*)")
-            print("   - Can be overridden with BOKEH_ALLOW_WS_ORIGIN env var")
-            return True
-        else:
-            print("❌ WebSocket configuration not updated properly")
-            return False
+    if b'BOKEH_ALLOW_WS_ORIGIN' in content and b"allowed_origins" in content:
+        print("✅ WebSocket origin configuration updated")
+        print("   - Default: Accept all origins (*)")
+        print("   - Can be overridden with BOKEH_ALLOW_WS_ORIGIN env var")
+        return True
+    else:
+        print("❌ WebSocket configuration not updated properly")
+        return False
 
 
 def test_network_resilience():
     """Test that network calls have timeout protection."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Testing Network Resilience")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        src_path = os.path.join(os.path.dirname(__file__), "src")
-        sys.path.insert(0, src_path)
+        if importlib.util.find_spec("fusion_cashflow.core.cashflow_engine") is None:
+            print("❌ Cashflow engine module not found (fusion_cashflow.core.cashflow_engine)")
+            return False
         
         from fusion_cashflow.core import cashflow_engine
         
@@ -141,18 +165,25 @@ def test_network_resilience():
 
 def test_static_files():
     """Check that static files exist."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Testing Static Files")
-    print("=" * 60)
+    print(_SEP)
     
     static_dir = os.path.join(os.path.dirname(__file__), "src", "fusion_cashflow", "ui", "static")
     required_files = ["logo.png", "favicon.ico"]
     
+    # One directory scan instead of an exists + getsize stat pair per file
+    try:
+        with os.scandir(static_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = {}
+    
     all_present = True
     for filename in required_files:
-        filepath = os.path.join(static_dir, filename)
-        if os.path.exists(filepath):
-            size = os.path.getsize(filepath)
+        entry = entries.get(filename)
+        if entry is not None and entry.is_file():
+            size = entry.stat().st_size
             print(f"✅ {filename} ({size:,} bytes)")
         else:
             print(f"❌ {filename} missing")
@@ -166,49 +197,66 @@ def test_static_files():
     return all_present
 
 
-def main():
-    """Run all verification tests."""
-    print("\n")
-    print("╔" + "=" * 58 + "╗")
-    print("║" + " " * 58 + "║")
-    print("║" + "   AWS Deployment Verification".center(58) + "║")
-    print("║" + " " * 58 + "║")
-    print("╚" + "=" * 58 + "╝")
-    print()
+# Checks that import the full application stack; --fast leaves these out
+_SLOW_CHECKS = {"Dashboard Import"}
+
+
+def main(argv=None):
+    """Run all verification tests (pass --fast to skip the slow import checks)."""
+    argv = sys.argv[1:] if argv is None else argv
+    fast = "--fast" in argv
+    
+    # Each section is buffered and written once, so a piped log gets a few
+    # large writes instead of one per line
+    with _buffered_stdout():
+        print("\n")
+        print("╔" + _HSEP + "╗")
+        print("║" + " " * 58 + "║")
+        print("║" + "   AWS Deployment Verification".center(58) + "║")
+        print("║" + " " * 58 + "║")
+        print("╚" + _HSEP + "╝")
+        print()
     
     results = []
     
-    results.append(("Module Imports", test_imports()))
-    results.append(("Dashboard Import", test_dashboard_import()))
-    results.append(("WebSocket Config", test_websocket_config()))
-    results.append(("Network Resilience", test_network_resilience()))
-    results.append(("Static Files", test_static_files()))
-    
-    print("\n" + "=" * 60)
-    print("Summary")
-    print("=" * 60)
-    
-    for test_name, passed in results:
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {test_name}")
-    
-    all_passed = all(result[1] for result in results)
-    
-    print("\n" + "=" * 60)
-    if all_passed:
-        print("✅ ALL TESTS PASSED - Ready for AWS deployment!")
-        print("\nNext steps:")
-        print("1. Push changes to GitHub main branch")
-        print("2. On AWS Lightsail, pull latest code")
-        print("3. Run: pip install -r requirements.txt")
-        print("4. Set: export BOKEH_ALLOW_WS_ORIGIN='*'")
-        print("5. Run: python run_dashboard_with_static.py")
-        print("\nSee AWS_DEPLOYMENT_GUIDE.md for detailed instructions")
-        return 0
-    else:
-        print("❌ SOME TESTS FAILED")
-        print("\nFix the issues above before deploying to AWS")
-        return 1
+    for test_name, test in (
+        ("Module Imports", test_imports),
+        ("Dashboard Import", test_dashboard_import),
+        ("WebSocket Config", test_websocket_config),
+        ("Network Resilience", test_network_resilience),
+        ("Static Files", test_static_files),
+    ):
+        if fast and test_name in _SLOW_CHECKS:
+            continue
+        with _buffered_stdout():
+            results.append((test_name, test()))
+    
+    with _buffered_stdout():
+        print("\n" + _SEP)
+        print("Summary")
+        print(_SEP)
+        
+        for test_name, passed in results:
+            status = "✅ PASS" if passed else "❌ FAIL"
+            print(f"{status}: {test_name}")
+        
+        all_passed = all(result[1] for result in results)
+        
+        print("\n" + _SEP)
+        if all_passed:
+            print("✅ ALL TESTS PASSED - Ready for AWS deployment!")
+            print("\nNext steps:")
+            print("1. Push changes to GitHub main branch")
+            print("2. On AWS Lightsail, pull latest code")
+            print("3. Run: pip install -r requirements.txt")
+            print("4. Set: export BOKEH_ALLOW_WS_ORIGIN='*'")
+            print("5. Run: python run_dashboard_with_static.py")
+            print("\nSee AWS_DEPLOYMENT_GUIDE.md for detailed instructions")
+            return 0
+        else:
+            print("❌ SOME TESTS FAILED")
+            print("\nFix the issues above before deploying to AWS")
+            return 1
 
 
 if __name__ == "__main__":